@@ -14,10 +14,10 @@ from typing import Any
 from wagents.candidate_evidence import (
     RUNTIME_DIGEST_IGNORED_DIRS,
     RUNTIME_PREDICATE_VERSION,
-    filesystem_digest,
 )
 from wagents.candidate_predicates import evaluate_predicate
 from wagents.candidate_receipts import ReceiptStore
+from wagents.fs_digest import filesystem_digest
 from wagents.parsing import parse_frontmatter
 from wagents.site_model import normalize_public_install_command
 
@@ -18,10 +18,8 @@ from pathlib import Path
 from typing import Any
 
 from wagents.candidate_evidence import (
-    FILESYSTEM_DIGEST_ALGORITHM,
     RUNTIME_DIGEST_IGNORED_DIRS,
     RUNTIME_PREDICATE_VERSION,
-    filesystem_digest,
     receipt_input_digest,
 )
 from wagents.candidate_mcp_activation import (
@@ -43,6 +41,7 @@ from wagents.candidate_plugin_provenance import (
 from wagents.candidate_predicates import evaluate_predicate
 from wagents.candidate_provenance import package_manager_provenance
 from wagents.candidate_receipts import ReceiptStore
+from wagents.fs_digest import FILESYSTEM_DIGEST_ALGORITHM, filesystem_digest
 
 ROOT = Path(__file__).resolve().parents[1]
 MANIFEST_DIR = ROOT / "planning" / "manifests" / "candidate-corpus-jul2026"
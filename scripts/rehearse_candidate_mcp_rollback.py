@@ -19,11 +19,11 @@ from typing import Any
 import anyio
 
 from wagents.candidate_evidence import (
-    FILESYSTEM_DIGEST_ALGORITHM,
     RUNTIME_DIGEST_IGNORED_DIRS,
     receipt_metadata,
 )
 from wagents.candidate_receipts import ReceiptStore
+from wagents.fs_digest import FILESYSTEM_DIGEST_ALGORITHM
 
 ROOT = Path(__file__).resolve().parents[1]
 ACTIVATION_SCRIPT = ROOT / "scripts/record_candidate_runtime_activation.py"
@@ -21,12 +21,12 @@ from pathlib import Path
 from typing import Any
 
 from wagents.candidate_evidence import (
-    FILESYSTEM_DIGEST_ALGORITHM,
     RUNTIME_DIGEST_IGNORED_DIRS,
     receipt_metadata,
 )
 from wagents.candidate_plugin_provenance import plugin_content_sha256
 from wagents.candidate_receipts import ReceiptStore
+from wagents.fs_digest import FILESYSTEM_DIGEST_ALGORITHM
 
 ROOT = Path(__file__).resolve().parents[1]
 CANARY_SCRIPT = ROOT / "scripts" / "run_candidate_plugin_canaries.py"
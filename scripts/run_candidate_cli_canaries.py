@@ -29,9 +29,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from wagents.candidate_evidence import (
-    FILESYSTEM_DIGEST_ALGORITHM,
     RUNTIME_DIGEST_IGNORED_DIRS,
-    filesystem_digest,
     receipt_metadata,
 )
 from wagents.candidate_receipts import ReceiptStore
@@ -42,6 +40,7 @@ from wagents.candidate_sandbox import (
     selected_javascript_package_roots,
     selected_macos_runtime_roots,
 )
+from wagents.fs_digest import FILESYSTEM_DIGEST_ALGORITHM, filesystem_digest
 from wagents.process_lifecycle import (
     run_after_process_lifecycle_gate,
     terminate_process_group,
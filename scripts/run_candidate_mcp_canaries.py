@@ -24,7 +24,7 @@ from mcp.client.stdio import stdio_client
 from mcp.shared.exceptions import McpError
 
 from mcp import ClientSession, StdioServerParameters
-from wagents.candidate_evidence import FILESYSTEM_DIGEST_ALGORITHM, receipt_metadata
+from wagents.candidate_evidence import receipt_metadata
 from wagents.candidate_provenance import package_manager_provenance
 from wagents.candidate_receipts import ReceiptStore
 from wagents.candidate_sandbox import (
@@ -34,6 +34,7 @@ from wagents.candidate_sandbox import (
     selected_javascript_package_roots,
     selected_macos_runtime_roots,
 )
+from wagents.fs_digest import FILESYSTEM_DIGEST_ALGORITHM
 
 ROOT = Path(__file__).resolve().parents[1]
 ACTIVATION_SCRIPT = ROOT / "scripts" / "record_candidate_runtime_activation.py"
@@ -21,9 +21,7 @@ from typing import TYPE_CHECKING, Any
 import yaml
 
 from wagents.candidate_evidence import (
-    FILESYSTEM_DIGEST_ALGORITHM,
     RUNTIME_DIGEST_IGNORED_DIRS,
-    filesystem_digest,
     receipt_metadata,
 )
 from wagents.candidate_plugin_provenance import (
@@ -41,6 +39,7 @@ from wagents.candidate_plugin_provenance import (
 )
 from wagents.candidate_receipts import ReceiptStore
 from wagents.candidate_sandbox import SANDBOX_REQUIRED_ENV, prepare_sandboxed_subprocess, sandbox_environment
+from wagents.fs_digest import FILESYSTEM_DIGEST_ALGORITHM, filesystem_digest
 from wagents.process_lifecycle import (
     run_after_process_lifecycle_gate,
     terminate_process_group,
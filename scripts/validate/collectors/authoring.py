@@ -9,7 +9,7 @@ from _toolkit import ensure_validate_importable
 ensure_validate_importable()
 
 from wagents.external_skills import curated_external_authoring_errors, is_external_authoring_source_kind
-from wagents.parsing import parse_frontmatter
+from wagents.parsing import read_frontmatter
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -24,7 +24,7 @@ def collect_authoring_errors(repo_root: Path) -> list[dict[str, str]]:
     errors: list[dict[str, str]] = []
     for path in sorted(authoring_dir.glob("*.mdx")):
         try:
-            frontmatter, _ = parse_frontmatter(path.read_text(encoding="utf-8"))
+            frontmatter, _ = read_frontmatter(path)
         except Exception as exc:
             errors.append({"source": str(path), "message": f"Invalid authoring frontmatter: {exc}"})
             continue
@@ -135,12 +135,12 @@ def _scan_authoring_for_slugs(repo_root: Path, slugs: list[str]) -> list[dict[st
     if not authoring_dir.is_dir():
         return []
 
-    from wagents.parsing import parse_frontmatter
+    from wagents.parsing import read_frontmatter
 
     errors: list[dict[str, str]] = []
     for path in sorted(authoring_dir.glob("*.mdx")):
         try:
-            frontmatter, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+            frontmatter, body = read_frontmatter(path)
         except Exception:
             continue
         name = str(frontmatter.get("name") or path.stem)
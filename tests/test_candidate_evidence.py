@@ -3,7 +3,8 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
-from wagents.candidate_evidence import RUNTIME_DIGEST_IGNORED_DIRS, filesystem_digest
+from wagents.candidate_evidence import RUNTIME_DIGEST_IGNORED_DIRS
+from wagents.fs_digest import filesystem_digest
 
 if TYPE_CHECKING:
     from pathlib import Path
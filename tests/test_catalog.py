@@ -1,13 +1,16 @@
 """Tests for wagents.catalog — node collection, deduplication, and edge extraction."""
 
+import subprocess
 from pathlib import Path
 
 from wagents.catalog import (
     RELATED_SKILLS,
+    CatalogEdge,
     CatalogNode,
     collect_edges,
     collect_installed_skills,
     collect_nodes,
+    group_edges_by_target,
 )
 from wagents.installed_inventory import HarnessQueryResult, InstalledInventorySnapshot, InstalledSkillInventoryRow
 
@@ -63,6 +66,31 @@ def test_collect_nodes_returns_all_kinds(tmp_repo):
     assert next(n for n in nodes if n.kind == "mcp").source_path == "mcp/test-mcp/server.py"
 
 
+def test_collect_nodes_skips_gitignored_mcp_dirs_with_one_git_call(tmp_repo, monkeypatch):
+    """Git-ignored MCP directories are excluded through a single batched check-ignore."""
+    subprocess.run(["git", "init"], cwd=tmp_repo, capture_output=True, check=False)
+    (tmp_repo / ".gitignore").write_text("mcp/scratch-*/\n")
+    for name in ("kept-mcp", "scratch-one", "scratch-two"):
+        mcp_dir = tmp_repo / "mcp" / name
+        mcp_dir.mkdir()
+        (mcp_dir / "pyproject.toml").write_text(f'[project]\nname = "mcp-{name}"\ndescription = "{name}"\n')
+
+    git_calls = []
+    real_run = subprocess.run
+
+    def counting_run(cmd, *args, **kwargs):
+        if cmd[0] == "git":
+            git_calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr("wagents.catalog.subprocess.run", counting_run)
+
+    nodes = collect_nodes()
+
+    assert [n.id for n in nodes if n.kind == "mcp"] == ["kept-mcp"]
+    assert len(git_calls) == 1
+
+
 # ---------------------------------------------------------------------------
 # collect_installed_skills — deduplication
 # ---------------------------------------------------------------------------
@@ -201,6 +229,16 @@ def test_collect_edges_from_agent_metadata():
     assert any(e.from_id == "agent:my-agent" and e.to_id == "mcp:bar" and e.relation == "uses-mcp" for e in edges)
 
 
+def test_group_edges_by_target_preserves_edge_order():
+    first = CatalogEdge(from_id="agent:a", to_id="skill:foo", relation="uses-skill")
+    second = CatalogEdge(from_id="agent:b", to_id="skill:foo", relation="uses-skill")
+    mcp = CatalogEdge(from_id="agent:a", to_id="mcp:bar", relation="uses-mcp")
+
+    grouped = group_edges_by_target([first, mcp, second])
+
+    assert grouped == {"skill:foo": [first, second], "mcp:bar": [mcp]}
+
+
 # ---------------------------------------------------------------------------
 # RELATED_SKILLS validation against the real repo
 # ---------------------------------------------------------------------------
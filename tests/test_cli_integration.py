@@ -26,7 +26,7 @@ REAL_REPO_ROOT = Path(__file__).resolve().parents[1]
 @pytest.fixture
 def patched_repo(tmp_path, monkeypatch):
     """Create a minimal repo skeleton in tmp_path and monkeypatch all ROOT refs."""
-    for mod in ["wagents", "wagents.cli", "wagents.catalog", "wagents.rendering"]:
+    for mod in ["wagents", "wagents.cli", "wagents.catalog", "wagents.commands.new", "wagents.rendering"]:
         monkeypatch.setattr(f"{mod}.ROOT", tmp_path)
     monkeypatch.setattr("wagents.rendering.CONTENT_DIR", tmp_path / "docs/src/content/docs")
     monkeypatch.setattr("wagents.CONTENT_DIR", tmp_path / "docs/src/content/docs")
@@ -273,6 +273,24 @@ def test_new_agent(patched_repo):
     assert "description" in fm
 
 
+def test_new_agent_skips_docs_for_other_repo_root(patched_repo, tmp_path_factory, monkeypatch):
+    """Docs scaffolding targets the imported checkout, so a different repo root skips it."""
+    import wagents.commands.new as new_module
+
+    other_root = tmp_path_factory.mktemp("other-repo")
+    (other_root / "agents").mkdir()
+    scaffolded = []
+    monkeypatch.setattr(new_module, "get_repo_root", lambda: other_root)
+    monkeypatch.setattr(new_module, "scaffold_doc_page", scaffolded.append)
+
+    result = runner.invoke(app, ["new", "agent", "tmp-other-agent"])
+
+    assert result.exit_code == 0, f"new agent failed:\n{result.output}"
+    assert (other_root / "agents" / "tmp-other-agent.md").exists()
+    assert scaffolded == []
+    assert "Skipped docs scaffold" in result.output
+
+
 # ---------------------------------------------------------------------------
 # 5. wagents new mcp — tmp_repo
 # ---------------------------------------------------------------------------
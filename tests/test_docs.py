@@ -6,12 +6,15 @@ import subprocess
 from contextlib import contextmanager
 from pathlib import Path
 
+import pytest
+
 from wagents.catalog import CatalogNode
 from wagents.docs import (
     CATALOG_BROWSER_THRESHOLD,
     _candidate_runtime_summary,
     _docs_generate_stale_reasons,
     _mcp_overview_badge_stale_reason,
+    _write_text_atomic,
     docs_generate,
     is_catalog_detail_relpath,
     render_sidebar_module,
@@ -335,7 +338,7 @@ class TestDocsGenerate:
             lambda **kwargs: [custom, installed] if kwargs.get("include_installed", True) else [custom],
         )
         monkeypatch.setattr("wagents.docs.collect_edges", lambda nodes: [])
-        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes: "---\ntitle: Test\n---\n")
+        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes, **_: "---\ntitle: Test\n---\n")
 
         docs_generate()
 
@@ -359,7 +362,7 @@ class TestDocsGenerate:
             lambda **kwargs: [custom, installed] if kwargs.get("include_installed", False) else [custom],
         )
         monkeypatch.setattr("wagents.docs.collect_edges", lambda nodes: [])
-        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes: "---\ntitle: Test\n---\n")
+        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes, **_: "---\ntitle: Test\n---\n")
 
         docs_generate(include_installed=True)
 
@@ -376,7 +379,7 @@ class TestDocsGenerate:
 
         monkeypatch.setattr("wagents.docs.collect_all_doc_nodes", _collect_all)
         monkeypatch.setattr("wagents.docs.collect_edges", lambda nodes: [])
-        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes: "---\ntitle: Test\n---\n")
+        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes, **_: "---\ntitle: Test\n---\n")
 
         docs_generate(include_installed=False)
 
@@ -395,7 +398,7 @@ class TestDocsGenerate:
         )
         monkeypatch.setattr("wagents.docs.collect_edges", lambda nodes: [])
         replaced = "---\ntitle: Replaced\n---\n\n{/* GENERATED */}\n"
-        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes: replaced)
+        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes, **_: replaced)
 
         skill_page = tmp_repo / "docs" / "src" / "content" / "docs" / "skills" / "catalog" / "custom" / "test-skill.mdx"
         skill_page.parent.mkdir(parents=True, exist_ok=True)
@@ -430,7 +433,7 @@ class TestDocsGenerate:
             lambda **kwargs: [_make_node("skill")],
         )
         monkeypatch.setattr("wagents.docs.collect_edges", lambda nodes: [])
-        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes: "---\ntitle: Test\n---\n")
+        monkeypatch.setattr("wagents.docs.render_page", lambda node, edges, nodes, **_: "---\ntitle: Test\n---\n")
 
         docs_generate(include_installed=False)
 
@@ -475,6 +478,45 @@ class TestWriteAgentsIndex:
         assert "1 agents available" in text
 
 
+class TestDetailPageWrites:
+    def test_unchanged_pages_are_not_rewritten(self, tmp_repo, monkeypatch):
+        import wagents.docs as docs_module
+
+        out_file = tmp_repo / "docs" / "src" / "content" / "docs" / "agents" / "test-agent.mdx"
+        out_file.parent.mkdir(parents=True)
+        out_file.write_text("same")
+        os.utime(out_file, ns=(1, 1))
+        node = _make_node("agent")
+        jobs = [(node, out_file, "agents/test-agent.mdx")]
+
+        monkeypatch.setattr(docs_module, "render_page", lambda node, edges, nodes, **_: "same")
+        assert docs_module._render_detail_pages(jobs, [], [node]) == ["agents/test-agent.mdx"]
+        assert out_file.stat().st_mtime_ns == 1
+
+        monkeypatch.setattr(docs_module, "render_page", lambda node, edges, nodes, **_: "changed")
+        docs_module._render_detail_pages(jobs, [], [node])
+        assert out_file.read_text() == "changed"
+
+    def test_prune_removes_only_unwritten_detail_pages(self, tmp_repo):
+        import wagents.docs as docs_module
+
+        content_dir = tmp_repo / "docs" / "src" / "content" / "docs"
+        keep = content_dir / "agents" / "keep.mdx"
+        orphan = content_dir / "agents" / "orphan.mdx"
+        index = content_dir / "agents" / "index.mdx"
+        external = content_dir / "skills" / "catalog" / "external" / "gone.mdx"
+        for path in (keep, orphan, index, external):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+
+        docs_module._prune_stale_detail_pages({keep})
+
+        assert keep.exists()
+        assert index.exists()
+        assert not orphan.exists()
+        assert not external.parent.exists()
+
+
 # ---------------------------------------------------------------------------
 # write_mcp_index
 # ---------------------------------------------------------------------------
@@ -499,6 +541,45 @@ class TestWriteMcpIndex:
         assert "1 MCP servers available" in text
 
 
+# ---------------------------------------------------------------------------
+# _write_text_atomic
+# ---------------------------------------------------------------------------
+
+
+class TestWriteTextAtomic:
+    def test_replaces_file_and_keeps_mode(self, tmp_path):
+        target = tmp_path / "generated.mjs"
+        target.write_text("old\n", encoding="utf-8")
+        target.chmod(0o640)
+        _write_text_atomic(target, "new\n")
+        assert target.read_bytes() == b"new\n"
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert [entry.name for entry in tmp_path.iterdir()] == ["generated.mjs"]
+
+    def test_new_file_gets_umask_mode_like_write_text(self, tmp_path, monkeypatch):
+        import wagents.docs as docs_module
+
+        plain = tmp_path / "plain.txt"
+        plain.write_text("x", encoding="utf-8")
+        _write_text_atomic(tmp_path / "atomic.txt", "x")
+        assert (tmp_path / "atomic.txt").stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
+        monkeypatch.setattr(docs_module, "_NEW_FILE_MODE", 0o600)
+        _write_text_atomic(tmp_path / "private.txt", "x")
+        assert (tmp_path / "private.txt").stat().st_mode & 0o777 == 0o600
+
+    def test_removes_temp_file_when_replace_fails(self, tmp_path, monkeypatch):
+        target = tmp_path / "generated.mjs"
+
+        def fail_replace(self, _target):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            _write_text_atomic(target, "payload")
+        assert list(tmp_path.iterdir()) == []
+
+
 # ---------------------------------------------------------------------------
 # write_sidebar
 # ---------------------------------------------------------------------------
@@ -887,6 +968,186 @@ class TestDocsGenerateCommand:
         assert events == ["enter", "exit"]
 
 
+class TestDocsBuildCommand:
+    def _setup(self, tmp_path, monkeypatch):
+        import wagents.docs as docs_module
+
+        docs_dir = tmp_path / "docs"
+        (docs_dir / "src").mkdir(parents=True)
+        (docs_dir / "src" / "index.mdx").write_text("# Home\n", encoding="utf-8")
+        builds = []
+
+        def fake_run(cmd, cwd):
+            builds.append(cmd)
+            (Path(cwd) / "dist").mkdir(exist_ok=True)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        @contextmanager
+        def fake_lock():
+            yield
+
+        monkeypatch.setattr(docs_module, "DOCS_DIR", docs_dir)
+        monkeypatch.setattr(docs_module, "_docs_generate_lock", fake_lock)
+        monkeypatch.setattr(docs_module, "_docs_generate_impl", lambda **kwargs: None)
+        monkeypatch.setattr(docs_module, "_current_utc_snapshot_date", lambda: "2026-07-29")
+        monkeypatch.setattr(docs_module.subprocess, "run", fake_run)
+        monkeypatch.setattr(docs_module, "_pnpm_executable", lambda: "/usr/bin/pnpm")
+        monkeypatch.setattr(docs_module, "_docs_toolchain_versions", lambda: ["node: v22.0.0", "pnpm: 10.0.0"])
+        monkeypatch.delenv("PUBLIC_POSTHOG_KEY", raising=False)
+        return docs_module, docs_dir, builds
+
+    def test_builds_every_time_by_default(self, tmp_path, monkeypatch):
+        docs_module, _docs_dir, builds = self._setup(tmp_path, monkeypatch)
+
+        docs_module.docs_build(incremental=False)
+        docs_module.docs_build(incremental=False)
+
+        assert builds == [["/usr/bin/pnpm", "build"], ["/usr/bin/pnpm", "build"]]
+
+    def test_incremental_skips_pnpm_build_when_inputs_unchanged(self, tmp_path, monkeypatch):
+        docs_module, docs_dir, builds = self._setup(tmp_path, monkeypatch)
+
+        docs_module.docs_build(incremental=True)
+        docs_module.docs_build(incremental=True)
+
+        assert builds == [["/usr/bin/pnpm", "build"]]
+        assert not (docs_dir / "dist" / docs_module.DOCS_BUILD_STAMP_NAME).exists()
+
+    def test_incremental_rebuilds_when_files_env_or_toolchain_change(self, tmp_path, monkeypatch):
+        docs_module, docs_dir, builds = self._setup(tmp_path, monkeypatch)
+
+        docs_module.docs_build(incremental=True)
+        (docs_dir / "src" / "index.mdx").write_text("# Changed\n", encoding="utf-8")
+        docs_module.docs_build(incremental=True)
+        monkeypatch.setenv("PUBLIC_POSTHOG_KEY", "phc_test")
+        docs_module.docs_build(incremental=True)
+        monkeypatch.setattr(docs_module, "_docs_toolchain_versions", lambda: ["node: v24.0.0", "pnpm: 10.0.0"])
+        docs_module.docs_build(incremental=True)
+        docs_module.docs_build(incremental=True)
+
+        assert len(builds) == 4
+
+    def test_toolchain_versions_report_missing_node(self, monkeypatch):
+        import wagents.docs as docs_module
+
+        monkeypatch.setattr(docs_module.shutil, "which", lambda name: None)
+        monkeypatch.setattr(docs_module, "_pnpm_executable", lambda: "/usr/bin/pnpm")
+        monkeypatch.setattr(
+            docs_module.subprocess,
+            "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout="10.0.0\n", stderr=""),
+        )
+
+        assert docs_module._docs_toolchain_versions() == ["node: missing", "pnpm: 10.0.0"]
+
+
+class TestDocsDevWatch:
+    def test_fingerprint_tracks_asset_edits_and_skips_local_mcp_dirs(self, tmp_repo):
+        import wagents.docs as docs_module
+
+        skill_file = tmp_repo / "skills" / "demo" / "SKILL.md"
+        skill_file.parent.mkdir()
+        skill_file.write_text("---\nname: demo\n---\n")
+        cache_file = tmp_repo / "mcp" / "cache" / "blob.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text("{}")
+
+        before = docs_module._docs_watch_fingerprint()
+        assert [Path(path).name for path, _mtime, _size in before] == ["SKILL.md"]
+        skill_file.write_text("---\nname: demo\ndescription: changed\n---\n")
+        assert docs_module._docs_watch_fingerprint() != before
+
+    def test_regenerates_once_per_settled_change(self, monkeypatch):
+        import wagents.docs as docs_module
+
+        fingerprints = iter(["a", "a", "b", "c", "c", "c", "c"])
+        polls = iter([None, None, None, 0])
+        generated = []
+
+        class FakeServer:
+            def poll(self):
+                return next(polls)
+
+        @contextmanager
+        def fake_lock(**_kwargs):
+            yield
+
+        monkeypatch.setattr(docs_module, "_docs_watch_fingerprint", lambda: next(fingerprints))
+        monkeypatch.setattr(docs_module.time, "sleep", lambda _seconds: None)
+        monkeypatch.setattr(docs_module, "_docs_generate_lock", fake_lock)
+        monkeypatch.setattr(docs_module, "_docs_generate_impl", lambda **kwargs: generated.append(kwargs))
+
+        docs_module._watch_and_regenerate(FakeServer(), snapshot_date="2026-07-29")
+
+        assert generated == [{"include_drafts": False, "include_installed": False, "snapshot_date": "2026-07-29"}]
+
+    def test_edit_during_regeneration_triggers_another_regeneration(self, monkeypatch):
+        import wagents.docs as docs_module
+
+        state = {"fingerprint": "a"}
+        polls = iter([None, None, None, 0])
+        generated = []
+
+        class FakeServer:
+            def poll(self):
+                if state["fingerprint"] == "a":
+                    state["fingerprint"] = "b"
+                return next(polls)
+
+        @contextmanager
+        def fake_lock(**_kwargs):
+            yield
+
+        def generate(**kwargs):
+            generated.append(kwargs)
+            if len(generated) == 1:
+                # A skill edit saved while the first regeneration is running.
+                state["fingerprint"] = "c"
+
+        monkeypatch.setattr(docs_module, "_docs_watch_fingerprint", lambda: state["fingerprint"])
+        monkeypatch.setattr(docs_module.time, "sleep", lambda _seconds: None)
+        monkeypatch.setattr(docs_module, "_docs_generate_lock", fake_lock)
+        monkeypatch.setattr(docs_module, "_docs_generate_impl", generate)
+
+        docs_module._watch_and_regenerate(FakeServer(), snapshot_date="2026-07-29")
+
+        assert len(generated) == 2
+
+    def test_busy_lock_retries_and_failures_keep_watching(self, monkeypatch, capsys):
+        import wagents.docs as docs_module
+
+        fingerprints = iter(["a", "b", "b", "b", "b", "b", "b"])
+        polls = iter([None, None, None, 0])
+        attempts = []
+
+        class FakeServer:
+            def poll(self):
+                return next(polls)
+
+        @contextmanager
+        def fake_lock(*, exit_when_busy=True):
+            assert exit_when_busy is False
+            attempts.append("lock")
+            if len(attempts) == 1:
+                raise docs_module.DocsGenerateLockBusyError("pid 123")
+            yield
+
+        def failing_generate(**_kwargs):
+            raise ValueError("bad frontmatter")
+
+        monkeypatch.setattr(docs_module, "_docs_watch_fingerprint", lambda: next(fingerprints))
+        monkeypatch.setattr(docs_module.time, "sleep", lambda _seconds: None)
+        monkeypatch.setattr(docs_module, "_docs_generate_lock", fake_lock)
+        monkeypatch.setattr(docs_module, "_docs_generate_impl", failing_generate)
+
+        docs_module._watch_and_regenerate(FakeServer(), snapshot_date="2026-07-29")
+
+        assert attempts == ["lock", "lock"]
+        err = capsys.readouterr().err
+        assert "Another docs generate is in progress (pid 123); retrying on the next poll." in err
+        assert "Docs regeneration failed: bad frontmatter; still watching." in err
+
+
 class TestDocsResearchCommand:
     def test_research_skill_filter(self, monkeypatch):
         from typer.testing import CliRunner
@@ -1,6 +1,9 @@
 """Tests for wagents.rendering — MDX escaping functions."""
 
+from wagents.parsing import sanitize_catalog_links
 from wagents.rendering import (
+    _catalog_prose,
+    _extract_dispatch_table,
     _extract_what_it_does,
     _sanitize_what_it_does,
     escape_mdx,
@@ -99,6 +102,14 @@ class TestEscapeMdx:
 # ---------------------------------------------------------------------------
 
 
+class TestCatalogProse:
+    def test_matches_escape_then_sanitize(self):
+        text = "Use {x} and [ref](refs/a.md) or [site](/skills/#top)\n```\n<keep> [ref](a.md)\n```\n"
+        assert _catalog_prose(text) == sanitize_catalog_links(escape_mdx(text), fence_aware=True)
+        assert "`ref`" in _catalog_prose(text)
+        assert "<keep> [ref](a.md)" in _catalog_prose(text)
+
+
 class TestSanitizeWhatItDoes:
     def test_rejects_code_fence_fragments(self):
         text = "``` </python> import { createDeepAgent } from 'deepagents';"
@@ -135,6 +146,30 @@ class TestExtractWhatItDoes:
         assert _extract_what_it_does(body) == ""
 
 
+class TestExtractDispatchTable:
+    def test_includes_header_rows(self):
+        body = (
+            "# Skill\n"
+            "\n"
+            "| Input | Action |\n"
+            "| --- | --- |\n"
+            "| `$ARGUMENTS` empty | Show gallery |\n"
+            "| `review` | Run review |\n"
+            "\n"
+            "## Next\n"
+        )
+        assert _extract_dispatch_table(body) == (
+            "| Input | Action |\n| --- | --- |\n| `$ARGUMENTS` empty | Show gallery |\n| `review` | Run review |"
+        )
+
+    def test_no_dispatch_table(self):
+        assert _extract_dispatch_table("# Skill\n\n| a | b |\n| --- | --- |\n") == ""
+
+    def test_duplicate_row_text_uses_actual_position(self):
+        body = "| `$ARGUMENTS` | x |\n\ntext\n| H | A |\n| --- | --- |\n| `$ARGUMENTS` | x |\n"
+        assert _extract_dispatch_table(body) == "| `$ARGUMENTS` | x |"
+
+
 # ---------------------------------------------------------------------------
 # safe_outer_fence
 # ---------------------------------------------------------------------------
@@ -164,3 +199,9 @@ class TestSafeOuterFence:
         content = "```\ncode\n```\n`````\nmore\n`````"
         result = safe_outer_fence(content)
         assert result == "``````"
+
+    def test_indented_fence_counted(self):
+        assert safe_outer_fence("text\n  ~~~~~\ncode\n  ~~~~~") == "``````"
+
+    def test_inline_backticks_not_counted(self):
+        assert safe_outer_fence("use ````` inline") == "````"
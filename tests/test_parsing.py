@@ -5,10 +5,12 @@ from pathlib import Path
 import pytest
 
 from wagents.parsing import (
+    _FRONTMATTER_CACHE,
     FenceTracker,
     escape_attr,
     is_navigable_catalog_link_target,
     parse_frontmatter,
+    read_frontmatter,
     sanitize_catalog_links,
     shift_headings,
     strip_relative_md_links,
@@ -109,6 +111,38 @@ class TestParseFrontmatter:
         assert "Some body." in body
 
 
+class TestReadFrontmatter:
+    def test_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "SKILL.md"
+        path.write_text("---\nname: x\nmetadata:\n  author: alice\n---\n\nBody.\n", encoding="utf-8")
+        fm, body = read_frontmatter(path)
+        assert body == "Body."
+        fm["metadata"]["author"] = "mallory"
+        assert read_frontmatter(path)[0]["metadata"]["author"] == "alice"
+
+    def test_rereads_after_file_changes(self, tmp_path):
+        path = tmp_path / "SKILL.md"
+        path.write_text("---\nname: before\n---\n", encoding="utf-8")
+        assert read_frontmatter(path)[0]["name"] == "before"
+        path.write_text("---\nname: after-edit\n---\n", encoding="utf-8")
+        assert read_frontmatter(path)[0]["name"] == "after-edit"
+
+    def test_edits_replace_the_cached_entry(self, tmp_path):
+        path = tmp_path / "SKILL.md"
+        for index in range(3):
+            path.write_text(f"---\nname: edit-{index}{'x' * index}\n---\n", encoding="utf-8")
+            assert read_frontmatter(path)[0]["name"] == f"edit-{index}{'x' * index}"
+        assert [key for key in _FRONTMATTER_CACHE if key.startswith(str(tmp_path))] == [str(path)]
+        assert _FRONTMATTER_CACHE[str(path)][2][0] == {"name": "edit-2xx"}
+
+    def test_translates_crlf_newlines(self, tmp_path):
+        path = tmp_path / "SKILL.md"
+        path.write_bytes(b"---\r\nname: crlf\r\n---\r\n\r\nLine one.\r\nLine two.\r\n")
+        fm, body = read_frontmatter(path)
+        assert fm == {"name": "crlf"}
+        assert body == "Line one.\nLine two."
+
+
 # ---------------------------------------------------------------------------
 # FenceTracker
 # ---------------------------------------------------------------------------
@@ -78,6 +78,33 @@ def test_readme_check_passes_when_up_to_date(tmp_repo):
     assert "up to date" in check_result.output
 
 
+def test_readme_skips_rewrite_when_up_to_date(tmp_repo):
+    """Regenerating an unchanged README leaves the file untouched."""
+    (tmp_repo / "pyproject.toml").write_text('[project]\nname = "wagents"\nversion = "0.1.0"\n')
+
+    assert runner.invoke(app, ["readme"]).exit_code == 0
+    readme_file = tmp_repo / "README.md"
+    mtime_ns = readme_file.stat().st_mtime_ns
+
+    result = runner.invoke(app, ["readme"])
+    assert result.exit_code == 0, result.output
+    assert "up to date" in result.output
+    assert readme_file.stat().st_mtime_ns == mtime_ns
+
+
+def test_readme_check_accepts_crlf_checkout(tmp_repo):
+    """A README checked out with CRLF line endings still counts as up to date."""
+    (tmp_repo / "pyproject.toml").write_text('[project]\nname = "wagents"\nversion = "0.1.0"\n')
+
+    assert runner.invoke(app, ["readme"]).exit_code == 0
+    readme_file = tmp_repo / "README.md"
+    readme_file.write_bytes(readme_file.read_bytes().replace(b"\n", b"\r\n"))
+
+    result = runner.invoke(app, ["readme", "--check"])
+    assert result.exit_code == 0, result.output
+    assert "up to date" in result.output
+
+
 # ---------------------------------------------------------------------------
 # --check mode: stale
 # ---------------------------------------------------------------------------
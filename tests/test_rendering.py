@@ -1,7 +1,12 @@
 """Tests for wagents.rendering — page renderers and utilities."""
 
+import json
+
+import pytest
+
 from wagents.catalog import CatalogEdge, CatalogNode
 from wagents.rendering import (
+    _RAW_TEXT_CACHE,
     read_raw_content,
     render_agent_page,
     render_mcp_page,
@@ -461,6 +466,24 @@ class TestRenderMcpPage:
         assert "## Resources" in result
         assert "View source on GitHub" in result
 
+    @pytest.mark.parametrize("server_id", ["test-mcp", 'quo"te\\back-caf\u00e9'])
+    def test_usage_config_matches_json_dump(self, tmp_repo, server_id):
+        node = _make_node(
+            "mcp", id=server_id, metadata={"project": {}, "fastmcp_config": {}}, source_path="mcp/test-mcp/server.py"
+        )
+        expected = json.dumps(
+            {
+                "mcpServers": {
+                    server_id: {
+                        "command": "uv",
+                        "args": ["run", "--directory", f"mcp/{server_id}", "python", "server.py"],
+                    }
+                }
+            },
+            indent=2,
+        )
+        assert f"```json\n{expected}\n```" in render_mcp_page(node, [], [node])
+
     def test_used_by_agents(self, tmp_repo):
         mcp_node = _make_node(
             "mcp",
@@ -488,6 +511,26 @@ class TestReadRawContent:
         node = _make_node("skill")
         assert read_raw_content(node) == raw
 
+    def test_rereads_after_file_changes(self, tmp_repo):
+        skill_dir = tmp_repo / "skills" / "test-skill"
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text("---\nname: test-skill\n---\n\n# Old\n")
+        node = _make_node("skill")
+        assert "# Old" in read_raw_content(node)
+        skill_file.write_text("---\nname: test-skill\n---\n\n# Newer body\n")
+        assert "# Newer body" in read_raw_content(node)
+
+    def test_edits_replace_the_cached_entry(self, tmp_repo):
+        skill_dir = tmp_repo / "skills" / "test-skill"
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        skill_file = skill_dir / "SKILL.md"
+        node = _make_node("skill")
+        for index in range(3):
+            skill_file.write_text(f"---\nname: test-skill\n---\n\n# Edit {index}{'!' * index}\n")
+            assert f"# Edit {index}" in read_raw_content(node)
+        assert [key for key in _RAW_TEXT_CACHE if key.startswith(str(tmp_repo))] == [str(skill_file)]
+
     def test_fallback_when_file_missing(self, tmp_repo):
         node = _make_node("skill", metadata={"name": "test-skill"}, body="# Fallback body")
         result = read_raw_content(node)
@@ -2,14 +2,27 @@
 
 import importlib.metadata
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from wagents.context import resolve_repo_root
 
 _discovered = resolve_repo_root()
 ROOT = _discovered if _discovered is not None else Path(__file__).resolve().parent.parent
-VERSION = importlib.metadata.version("wagents")
 KEBAB_CASE_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*$")
 GITHUB_BASE = "https://github.com/wyattowalsh/agents/blob/main"
 DOCS_DIR = ROOT / "docs"
 CONTENT_DIR = DOCS_DIR / "src" / "content" / "docs"
+
+
+@lru_cache(maxsize=1)
+def package_version() -> str:
+    """Return the installed wagents version; the metadata scan runs only on first use."""
+    return importlib.metadata.version("wagents")
+
+
+def __getattr__(name: str) -> str:
+    # VERSION stays importable, but commands that never print it skip the lookup.
+    if name == "VERSION":
+        return package_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
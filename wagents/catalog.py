@@ -1,8 +1,10 @@
 """Data model and collection functions for skills, agents, and MCP servers."""
 
 import json
+import os
 import subprocess
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,9 +12,10 @@ import typer
 
 from wagents import KEBAB_CASE_PATTERN, ROOT
 from wagents.installed_inventory import collect_installed_inventory
-from wagents.parsing import parse_frontmatter, to_title
+from wagents.parsing import parse_frontmatter, read_frontmatter, to_title
 
 LOCAL_MCP_DIR_NAMES = {"archives", "cache", "notes", "secrets", "servers"}
+INSTALLED_SKILL_READ_MAX_WORKERS = 8
 
 
 @dataclass
@@ -83,32 +86,42 @@ def _load_installed_skill_sources() -> dict[str, dict]:
     return merged
 
 
-def _is_git_ignored(path: Path) -> bool:
-    try:
-        rel_path = path.relative_to(ROOT)
-    except ValueError:
-        return False
-    candidates = [str(rel_path)]
-    if path.is_dir():
-        candidates.append(str(rel_path / "__wagents_check__"))
-    for candidate in candidates:
+def _git_ignored(paths: list[Path]) -> set[Path]:
+    """Return the members of *paths* ignored by this repo's git rules.
+
+    All candidates go through one ``git check-ignore --stdin`` call instead of a
+    subprocess per path.
+    """
+    candidates: dict[str, Path] = {}
+    for path in paths:
         try:
-            result = subprocess.run(
-                ["git", "-C", str(ROOT), "check-ignore", "-q", candidate],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
-            )
-        except OSError:
-            return False
-        if result.returncode == 0:
-            return True
-    return False
+            rel_path = path.relative_to(ROOT)
+        except ValueError:
+            continue
+        candidates[str(rel_path)] = path
+        if path.is_dir():
+            candidates[str(rel_path / "__wagents_check__")] = path
+    if not candidates:
+        return set()
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(ROOT), "check-ignore", "-z", "--stdin"],
+            input="".join(f"{candidate}\0" for candidate in candidates),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return set()
+    if result.returncode != 0:
+        return set()
+    return {candidates[match] for match in result.stdout.split("\0") if match in candidates}
 
 
-def _is_local_mcp_dir(path: Path) -> bool:
-    """Return whether an MCP subdirectory is reserved for local machine assets."""
-    return path.name in LOCAL_MCP_DIR_NAMES or _is_git_ignored(path)
+def _local_mcp_dirs(paths: list[Path]) -> set[Path]:
+    """Return the MCP subdirectories reserved for local machine assets."""
+    reserved = {path for path in paths if path.name in LOCAL_MCP_DIR_NAMES}
+    return reserved | _git_ignored([path for path in paths if path not in reserved])
 
 
 def _collect_mcp_nodes(nodes: list[CatalogNode]) -> None:
@@ -117,10 +130,10 @@ def _collect_mcp_nodes(nodes: list[CatalogNode]) -> None:
     if not mcp_dir.exists():
         return
 
-    for mcp_subdir in sorted(mcp_dir.iterdir()):
-        if not mcp_subdir.is_dir():
-            continue
-        if _is_local_mcp_dir(mcp_subdir):
+    mcp_subdirs = [path for path in sorted(mcp_dir.iterdir()) if path.is_dir()]
+    local_dirs = _local_mcp_dirs(mcp_subdirs)
+    for mcp_subdir in mcp_subdirs:
+        if mcp_subdir in local_dirs:
             continue
         pyproject = mcp_subdir / "pyproject.toml"
         server_py = mcp_subdir / "server.py"
@@ -155,58 +168,74 @@ def _collect_mcp_nodes(nodes: list[CatalogNode]) -> None:
             typer.echo(f"Warning: skipping {mcp_subdir}: {e}", err=True)
 
 
+def skill_dirs(skills_dir: Path) -> list[Path]:
+    """Return the subdirectories of *skills_dir* sorted by name; empty when it is missing.
+
+    ``os.scandir`` entries carry their file type, so plain directories need no extra stat,
+    and sorting bare names avoids ``Path`` comparisons.
+    """
+    try:
+        with os.scandir(skills_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir())
+    except FileNotFoundError:
+        return []
+    return [skills_dir / name for name in names]
+
+
+def agent_files(agents_dir: Path) -> list[Path]:
+    """Return the ``*.md`` files directly under *agents_dir* sorted by name; empty when it is missing."""
+    try:
+        with os.scandir(agents_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file())
+    except FileNotFoundError:
+        return []
+    return [agents_dir / name for name in names]
+
+
 def collect_nodes() -> list[CatalogNode]:
     """Scan skills/, agents/, and repo-authored mcp/<name>/ servers."""
     nodes = []
 
     # Skills
-    skills_dir = ROOT / "skills"
-    if skills_dir.exists():
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if not skill_dir.is_dir():
-                continue
-            skill_file = skill_dir / "SKILL.md"
-            if not skill_file.exists():
-                continue
-            try:
-                content = skill_file.read_text()
-                fm, body = parse_frontmatter(content)
-                nodes.append(
-                    CatalogNode(
-                        kind="skill",
-                        id=fm.get("name", skill_dir.name),
-                        title=to_title(fm.get("name", skill_dir.name)),
-                        description=str(fm.get("description", "")),
-                        metadata=fm,
-                        body=body,
-                        source_path=f"skills/{skill_dir.name}/SKILL.md",
-                    )
+    for skill_dir in skill_dirs(ROOT / "skills"):
+        skill_file = skill_dir / "SKILL.md"
+        try:
+            fm, body = read_frontmatter(skill_file)
+            nodes.append(
+                CatalogNode(
+                    kind="skill",
+                    id=fm.get("name", skill_dir.name),
+                    title=to_title(fm.get("name", skill_dir.name)),
+                    description=str(fm.get("description", "")),
+                    metadata=fm,
+                    body=body,
+                    source_path=f"skills/{skill_dir.name}/SKILL.md",
                 )
-            except Exception as e:
-                typer.echo(f"Warning: skipping {skill_file}: {e}", err=True)
+            )
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            typer.echo(f"Warning: skipping {skill_file}: {e}", err=True)
 
     # Agents
-    agents_dir = ROOT / "agents"
-    if agents_dir.exists():
-        for agent_file in sorted(agents_dir.glob("*.md")):
-            if agent_file.name == "README.md":
-                continue
-            try:
-                content = agent_file.read_text()
-                fm, body = parse_frontmatter(content)
-                nodes.append(
-                    CatalogNode(
-                        kind="agent",
-                        id=fm.get("name", agent_file.stem),
-                        title=to_title(fm.get("name", agent_file.stem)),
-                        description=str(fm.get("description", "")),
-                        metadata=fm,
-                        body=body,
-                        source_path=f"agents/{agent_file.name}",
-                    )
+    for agent_file in agent_files(ROOT / "agents"):
+        if agent_file.name == "README.md":
+            continue
+        try:
+            fm, body = read_frontmatter(agent_file)
+            nodes.append(
+                CatalogNode(
+                    kind="agent",
+                    id=fm.get("name", agent_file.stem),
+                    title=to_title(fm.get("name", agent_file.stem)),
+                    description=str(fm.get("description", "")),
+                    metadata=fm,
+                    body=body,
+                    source_path=f"agents/{agent_file.name}",
                 )
-            except Exception as e:
-                typer.echo(f"Warning: skipping {agent_file}: {e}", err=True)
+            )
+        except Exception as e:
+            typer.echo(f"Warning: skipping {agent_file}: {e}", err=True)
 
     _collect_mcp_nodes(nodes)
 
@@ -221,22 +250,39 @@ def collect_installed_skills(existing_ids: set[str]) -> list[CatalogNode]:
     return _collect_legacy_installed_skills(existing_ids)
 
 
+def _read_installed_skill_file(source_path: str) -> tuple[Path, dict, str] | None:
+    """Resolve and parse an installed SKILL.md; None when the file is missing."""
+    skill_file = Path(source_path)
+    if skill_file.is_dir():
+        skill_file = skill_file / "SKILL.md"
+    if not skill_file.exists():
+        return None
+    fm, body = parse_frontmatter(skill_file.read_text(encoding="utf-8", errors="replace"))
+    return skill_file, fm, body
+
+
 def _catalog_nodes_from_inventory(rows, existing_ids: set[str]) -> list[CatalogNode]:
     nodes: list[CatalogNode] = []
     seen_ids: set[str] = set()
-    for row in rows:
-        if row.name in existing_ids or row.name in seen_ids:
-            continue
-        skill_file = Path(row.source_path)
-        if skill_file.is_dir():
-            skill_file = skill_file / "SKILL.md"
-        if not skill_file.exists():
+    candidates = [row for row in rows if row.name not in existing_ids]
+    if not candidates:
+        return nodes
+    # Installed skills live across harness directories; overlap the file reads,
+    # then resolve duplicates in inventory order exactly as a serial scan would.
+    workers = min(len(candidates), INSTALLED_SKILL_READ_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_read_installed_skill_file, row.source_path) for row in candidates]
+    for row, future in zip(candidates, futures, strict=True):
+        if row.name in seen_ids:
             continue
         try:
-            fm, body = parse_frontmatter(skill_file.read_text(encoding="utf-8", errors="replace"))
+            parsed = future.result()
         except Exception as exc:
             typer.echo(f"Warning: skipping installed skill {row.name}: {exc}", err=True)
             continue
+        if parsed is None:
+            continue
+        skill_file, fm, body = parsed
         metadata = dict(fm)
         if row.source:
             metadata["_skills_source"] = row.source
@@ -303,7 +349,7 @@ def _collect_legacy_installed_skills(existing_ids: set[str]) -> list[CatalogNode
                 CatalogNode(
                     kind="skill",
                     id=resolved_id,
-                    title=to_title(skill_name if KEBAB_CASE_PATTERN.match(str(skill_name)) else dir_name),
+                    title=to_title(resolved_id),
                     description=str(fm.get("description", f"Installed skill: {dir_name}")),
                     metadata=metadata,
                     body=body,
@@ -346,3 +392,22 @@ def collect_edges(nodes: list[CatalogNode]) -> list[CatalogEdge]:
                     )
                 )
     return edges
+
+
+def index_nodes_by_key(nodes: list[CatalogNode]) -> dict[tuple[str, str], CatalogNode]:
+    """Index nodes by ``(kind, id)`` so renderers resolve cross-links in O(1).
+
+    The first node wins on duplicate keys, matching a linear scan of *nodes*.
+    """
+    index: dict[tuple[str, str], CatalogNode] = {}
+    for node in nodes:
+        index.setdefault((node.kind, node.id), node)
+    return index
+
+
+def group_edges_by_target(edges: list[CatalogEdge]) -> dict[str, list[CatalogEdge]]:
+    """Index edges by ``to_id`` so renderers look up incoming edges in O(1)."""
+    grouped: dict[str, list[CatalogEdge]] = {}
+    for edge in edges:
+        grouped.setdefault(edge.to_id, []).append(edge)
+    return grouped
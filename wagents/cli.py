@@ -13,9 +13,10 @@ from typing import Annotated, Any, cast
 
 import typer
 
-from wagents import ROOT, VERSION
-from wagents.catalog import CatalogNode
-from wagents.commands.validate import register_validate_commands, validate_name
+from wagents import ROOT, package_version
+from wagents.catalog import agent_files, collect_nodes, skill_dirs
+from wagents.commands.new import register_new_commands
+from wagents.commands.validate import register_validate_commands
 from wagents.context import (
     REPO_ROOT_ENV,
     bootstrap_cli_context,
@@ -23,7 +24,7 @@ from wagents.context import (
     get_repo_root,
     get_repo_root_optional,
 )
-from wagents.docs import docs_app, regenerate_sidebar_and_indexes
+from wagents.docs import docs_app
 
 # Eval adequacy (structural E3/E4 grader)
 from wagents.eval_adequacy import (
@@ -58,11 +59,10 @@ from wagents.openspec import (
     select_openspec_tools,
 )
 from wagents.output import emit_structured_output, normalize_output_format
-from wagents.parsing import parse_frontmatter, to_title
+from wagents.parsing import read_frontmatter
 from wagents.platforms.base import HOME
 from wagents.platforms.cursor import ensure_cursor_authoritative_links
 from wagents.plugins import load_command_plugins
-from wagents.rendering import scaffold_doc_page
 from wagents.self_cmd import self_app
 from wagents.site_model import (
     REPO_SOURCE,
@@ -168,6 +168,7 @@ apm_app = typer.Typer(
     help="APM (Microsoft Agent Package Manager) facade: materialize .apm/, doctor, refresh-lock"
 )
 app.add_typer(apm_app, name="apm")
+register_new_commands(new_app)
 register_validate_commands(app)
 
 _PLUGIN_RESULTS = load_command_plugins(app)
@@ -220,13 +221,12 @@ SKILL_SOURCES = (
     "opencode",
     "plugin",
 )
-LOCAL_MCP_DIR_NAMES = {"archives", "cache", "notes", "secrets", "servers"}
 
 
 def version_callback(value: bool):
     """Print version and exit."""
     if value:
-        typer.echo(f"wagents {VERSION}")
+        typer.echo(f"wagents {package_version()}")
         raise typer.Exit()
 
 
@@ -278,34 +278,6 @@ def _format_error(source: str, message: str) -> str:
     return f"{source}: {message}"
 
 
-def _is_git_ignored(path: Path) -> bool:
-    """Return whether *path* is ignored by this repo's git rules."""
-    try:
-        rel_path = path.relative_to(ROOT)
-    except ValueError:
-        return False
-    candidates = [str(rel_path)]
-    if path.is_dir():
-        candidates.append(str(rel_path / "__wagents_check__"))
-    for candidate in candidates:
-        try:
-            result = subprocess.run(
-                ["git", "-C", str(ROOT), "check-ignore", "-q", candidate],
-                capture_output=True,
-                check=False,
-            )
-        except OSError:
-            return False
-        if result.returncode == 0:
-            return True
-    return False
-
-
-def _is_local_mcp_dir(path: Path) -> bool:
-    """Return whether an MCP subdirectory is reserved for local machine assets."""
-    return path.name in LOCAL_MCP_DIR_NAMES or _is_git_ignored(path)
-
-
 def _normalize_skill_source(source: str) -> str:
     """Normalize and validate a requested skill source."""
     normalized = source.lower()
@@ -337,32 +309,23 @@ def _collect_hooks():
                     err=True,
                 )
 
-    skills_dir = ROOT / "skills"
-    if skills_dir.exists():
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if not skill_dir.is_dir():
-                continue
-            skill_file = skill_dir / "SKILL.md"
-            if not skill_file.exists():
-                continue
-            try:
-                fm, _ = parse_frontmatter(skill_file.read_text())
-                hooks_dict = fm.get("hooks", {})
-                if hooks_dict:
-                    all_hooks.extend(extract_hooks(f"skill:{skill_dir.name}", hooks_dict))
-            except Exception:
-                pass
-
-    agents_dir = ROOT / "agents"
-    if agents_dir.exists():
-        for agent_file in sorted(agents_dir.glob("*.md")):
-            try:
-                fm, _ = parse_frontmatter(agent_file.read_text())
-                hooks_dict = fm.get("hooks", {})
-                if hooks_dict:
-                    all_hooks.extend(extract_hooks(f"agent:{agent_file.stem}", hooks_dict))
-            except Exception:
-                pass
+    for skill_dir in skill_dirs(ROOT / "skills"):
+        try:
+            fm, _ = read_frontmatter(skill_dir / "SKILL.md")
+            hooks_dict = fm.get("hooks", {})
+            if hooks_dict:
+                all_hooks.extend(extract_hooks(f"skill:{skill_dir.name}", hooks_dict))
+        except Exception:
+            pass
+
+    for agent_file in agent_files(ROOT / "agents"):
+        try:
+            fm, _ = read_frontmatter(agent_file)
+            hooks_dict = fm.get("hooks", {})
+            if hooks_dict:
+                all_hooks.extend(extract_hooks(f"agent:{agent_file.stem}", hooks_dict))
+        except Exception:
+            pass
 
     hook_registry_file = ROOT / "config" / "hook-registry.json"
     if hook_registry_file.exists():
@@ -1013,215 +976,6 @@ def media_optimize_image(
         raise typer.Exit(code=2)
 
 
-@new_app.command("skill")
-def new_skill(
-    name: str,
-    no_docs: bool = typer.Option(False, "--no-docs", help="Skip docs page scaffold"),
-):
-    """Create a new skill from template."""
-    scaffold_script = _skill_creator_scripts() / "scaffold_skill.py"
-    code = _run_python_script(scaffold_script, [name])
-    if code != 0:
-        raise typer.Exit(code=code)
-    skill_file = ROOT / "skills" / name / "SKILL.md"
-    content = skill_file.read_text()
-
-    if not no_docs:
-        fm, body = parse_frontmatter(content)
-        node = CatalogNode(
-            kind="skill",
-            id=name,
-            title=to_title(name),
-            description=str(fm.get("description", "")),
-            metadata=fm,
-            body=body,
-            source_path=f"skills/{name}/SKILL.md",
-        )
-        scaffold_doc_page(node)
-        regenerate_sidebar_and_indexes()
-        typer.echo("Regenerated sidebar and index pages")
-
-
-@new_app.command("agent")
-def new_agent(
-    name: str,
-    no_docs: bool = typer.Option(False, "--no-docs", help="Skip docs page scaffold"),
-):
-    """Create a new agent from template."""
-    validate_name(name)
-    agents_dir = ROOT / "agents"
-    agent_file = agents_dir / f"{name}.md"
-
-    if agent_file.exists():
-        typer.echo(f"Error: {agent_file} already exists", err=True)
-        raise typer.Exit(code=1)
-
-    agents_dir.mkdir(parents=True, exist_ok=True)
-
-    title = to_title(name)
-    content = f"""---
-name: {name}
-description: TODO — When Claude should delegate to this agent
-
-# tools: Read, Glob, Grep, Bash            # Tool allowlist (inherits all if omitted)
-# disallowedTools: Write, Edit              # Tool denylist (removed from inherited set)
-# model: sonnet                             # Model: sonnet | opus | haiku | inherit
-# permissionMode: default                   # default | acceptEdits | delegate | dontAsk | bypassPermissions | plan
-# maxTurns: 50                              # Maximum agentic turns before stopping
-# skills:                                   # Skills preloaded into agent context
-#   - skill-name
-# mcpServers:                               # MCP servers available to this agent
-#   - server-name
-# memory: project                           # Persistent memory: user | project | local
-# hooks:                                    # Lifecycle hooks scoped to this agent
-#   PreToolUse:
-#     - matcher: Bash
-#       hooks: [{{command: "echo check"}}]
----
-
-# {title}
-
-This is the agent's system prompt. Everything below the frontmatter
-is injected as instructions when this agent is spawned.
-
-## Capabilities
-
-Describe what this agent specializes in.
-
-## Guidelines
-
-Rules and constraints for this agent's behavior.
-"""
-
-    agent_file.write_text(content)
-    typer.echo(f"Created agents/{name}.md")
-
-    if not no_docs:
-        fm, body = parse_frontmatter(content)
-        node = CatalogNode(
-            kind="agent",
-            id=name,
-            title=to_title(name),
-            description=str(fm.get("description", "")),
-            metadata=fm,
-            body=body,
-            source_path=f"agents/{name}.md",
-        )
-        scaffold_doc_page(node)
-        regenerate_sidebar_and_indexes()
-        typer.echo("Regenerated sidebar and index pages")
-
-
-@new_app.command("mcp")
-def new_mcp(
-    name: str,
-    no_docs: bool = typer.Option(False, "--no-docs", help="Skip docs page scaffold"),
-):
-    """Create a new MCP server from template."""
-    validate_name(name)
-    mcp_dir = ROOT / "mcp" / name
-
-    if mcp_dir.exists():
-        typer.echo(f"Error: {mcp_dir} already exists", err=True)
-        raise typer.Exit(code=1)
-
-    mcp_dir.mkdir(parents=True, exist_ok=True)
-
-    title = to_title(name)
-
-    # Create server.py
-    server_content = f'''"""MCP server: {name}."""
-
-from fastmcp import FastMCP
-
-mcp = FastMCP("{title}")
-
-
-@mcp.tool
-def hello(query: str) -> str:
-    """Example tool — replace with your implementation."""
-    return f"Hello from {name}: {{query}}"
-'''
-    (mcp_dir / "server.py").write_text(server_content)
-
-    # Create pyproject.toml
-    pyproject_content = f"""[project]
-name = "mcp-{name}"
-version = "0.1.0"
-description = "TODO — What this MCP server does"
-requires-python = ">=3.13"
-dependencies = ["fastmcp>=2"]
-
-[build-system]
-requires = ["hatchling"]
-build-backend = "hatchling.build"
-"""
-    (mcp_dir / "pyproject.toml").write_text(pyproject_content)
-
-    # Create fastmcp.json
-    fastmcp_config = {
-        "$schema": "https://gofastmcp.com/public/schemas/fastmcp.json/v1.json",
-        "source": {"path": "server.py", "entrypoint": "mcp"},
-        "environment": {"type": "uv"},
-    }
-    (mcp_dir / "fastmcp.json").write_text(json.dumps(fastmcp_config, indent=2) + "\n")
-
-    # Update root pyproject.toml if needed
-    root_pyproject = ROOT / "pyproject.toml"
-    content = root_pyproject.read_text()
-
-    workspace_member = f"mcp/{name}"
-    if "[tool.uv.workspace]" not in content:
-        if not content.endswith("\n"):
-            content += "\n"
-        content += f'\n[tool.uv.workspace]\nmembers = ["{workspace_member}"]\n'
-        root_pyproject.write_text(content)
-    elif f'"{workspace_member}"' not in content and f"'{workspace_member}'" not in content:
-        workspace_match = re.search(r"(?ms)^\[tool\.uv\.workspace\]\n(?P<body>.*?)(?=^\[|\Z)", content)
-        if workspace_match:
-            body = workspace_match.group("body")
-            members_match = re.search(r"(?ms)^members\s*=\s*\[(?P<members>.*?)\]", body)
-            if members_match:
-                replacement = f"members = [{members_match.group('members').strip()}]"
-                if members_match.group("members").strip():
-                    replacement = replacement[:-1] + f', "{workspace_member}"]'
-                else:
-                    replacement = f'members = ["{workspace_member}"]'
-                start = workspace_match.start("body") + members_match.start()
-                end = workspace_match.start("body") + members_match.end()
-                content = content[:start] + replacement + content[end:]
-            else:
-                insert_at = workspace_match.start("body")
-                content = content[:insert_at] + f'members = ["{workspace_member}"]\n' + content[insert_at:]
-            root_pyproject.write_text(content)
-
-    typer.echo(f"Created mcp/{name}/ with server.py, pyproject.toml, and fastmcp.json")
-
-    if not no_docs:
-        metadata = {
-            "project": {
-                "name": f"mcp-{name}",
-                "version": "0.1.0",
-                "description": "TODO — What this MCP server does",
-                "requires-python": ">=3.13",
-                "dependencies": ["fastmcp>=2"],
-            },
-            "fastmcp_config": fastmcp_config,
-        }
-        node = CatalogNode(
-            kind="mcp",
-            id=name,
-            title=to_title(name),
-            description="TODO — What this MCP server does",
-            metadata=metadata,
-            body=server_content,
-            source_path=f"mcp/{name}/server.py",
-        )
-        scaffold_doc_page(node)
-        regenerate_sidebar_and_indexes()
-        typer.echo("Regenerated sidebar and index pages")
-
-
 SUPPORTED_AGENTS = list(SUPPORTED_AGENT_IDS)
 UNRESOLVED_PROVENANCE = frozenset({"curated-unresolved", "read-only-discovered"})
 
@@ -2756,50 +2510,14 @@ def readme(
     format_: str = typer.Option("text", "--format", help="Output format: text, json, jsonl"),
 ):
     """Generate or check README.md."""
-    skills = []
-    skills_dir = ROOT / "skills"
-    if skills_dir.exists():
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if not skill_dir.is_dir():
-                continue
-            skill_file = skill_dir / "SKILL.md"
-            if skill_file.exists():
-                try:
-                    fm, _ = parse_frontmatter(skill_file.read_text())
-                    name = fm.get("name", skill_dir.name)
-                    skills.append((name, fm.get("description", "")))
-                except Exception as e:
-                    typer.echo(f"Warning: skipping {skill_file}: {e}", err=True)
-
-    agents = []
-    agents_dir = ROOT / "agents"
-    if agents_dir.exists():
-        for agent_file in sorted(agents_dir.glob("*.md")):
-            if agent_file.name == "README.md":
-                continue
-            try:
-                fm, _ = parse_frontmatter(agent_file.read_text())
-                agents.append((fm.get("name", agent_file.stem), fm.get("description", "")))
-            except Exception as e:
-                typer.echo(f"Warning: skipping {agent_file}: {e}", err=True)
-
-    mcps = []
-    mcp_dir = ROOT / "mcp"
-    if mcp_dir.exists():
-        for mcp_subdir in sorted(mcp_dir.iterdir()):
-            if not mcp_subdir.is_dir():
-                continue
-            if _is_local_mcp_dir(mcp_subdir):
-                continue
-            pyproject = mcp_subdir / "pyproject.toml"
-            if pyproject.exists():
-                try:
-                    data = tomllib.loads(pyproject.read_text())
-                    name = data.get("project", {}).get("name", mcp_subdir.name)
-                    desc = data.get("project", {}).get("description", "")
-                    mcps.append((name, desc))
-                except Exception:
-                    mcps.append((mcp_subdir.name, ""))
+    nodes = collect_nodes()
+    skills = [(node.id, node.description) for node in nodes if node.kind == "skill"]
+    agents = [(node.id, node.description) for node in nodes if node.kind == "agent"]
+    mcps = [
+        (node.metadata.get("project", {}).get("name", node.id), node.description)
+        for node in nodes
+        if node.kind == "mcp"
+    ]
 
     logo_repo_path = docs_asset_repo_path(VISUAL_ASSET_BY_ID["logo"].src)
     social_card_repo_path = docs_asset_repo_path(VISUAL_ASSET_BY_ID["social-card"].src)
@@ -2937,8 +2655,7 @@ def readme(
             "| Name | Description |",
             "| ---- | ----------- |",
         ])
-        for name, desc in skills:
-            content_parts.append(f"| {name} | {desc} |")
+        content_parts.extend(f"| {name} | {desc} |" for name, desc in skills)
         content_parts.append("")
 
     if agents:
@@ -2950,8 +2667,7 @@ def readme(
             "| Name | Description |",
             "| ---- | ----------- |",
         ])
-        for name, desc in agents:
-            content_parts.append(f"| {name} | {desc} |")
+        content_parts.extend(f"| {name} | {desc} |" for name, desc in agents)
         content_parts.append("")
 
     if mcps:
@@ -2967,8 +2683,7 @@ def readme(
             "| Name | Description |",
             "| ---- | ----------- |",
         ])
-        for name, desc in mcps:
-            content_parts.append(f"| {name} | {desc} |")
+        content_parts.extend(f"| {name} | {desc} |" for name, desc in mcps)
         content_parts.append("")
 
     # Dev commands
@@ -3051,7 +2766,8 @@ def readme(
 
     readme_file = ROOT / "README.md"
 
-    up_to_date = readme_file.exists() and readme_file.read_text() == generated_content
+    # Text-mode read normalizes newlines, so a CRLF checkout still counts as current.
+    up_to_date = readme_file.exists() and readme_file.read_text(encoding="utf-8") == generated_content
     payload: dict[str, object] = {
         "check": check,
         "path": str(readme_file),
@@ -3081,10 +2797,11 @@ def readme(
         else:
             _emit_structured_output(format_, json_data=payload, jsonl_records=[{"type": "readme", **payload}])
     else:
-        readme_file.write_text(generated_content)
-        payload["written"] = True
+        if not up_to_date:
+            readme_file.write_text(generated_content, encoding="utf-8")
+            payload["written"] = True
         if _normalize_output_format(format_) == "text":
-            typer.echo("Updated README.md")
+            typer.echo("Updated README.md" if payload["written"] else "README.md is up to date")
         else:
             _emit_structured_output(format_, json_data=payload, jsonl_records=[{"type": "readme", **payload}])
 
@@ -1,5 +1,6 @@
 """Typer command groups extracted from wagents.cli."""
 
-from wagents.commands.validate import register_validate_commands, validate_name
+from wagents.commands.new import register_new_commands
+from wagents.commands.validate import register_validate_commands, run_python_script, validate_name
 
-__all__ = ["register_validate_commands", "validate_name"]
+__all__ = ["register_new_commands", "register_validate_commands", "run_python_script", "validate_name"]
@@ -0,0 +1,254 @@
+"""New-asset scaffold command registration."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING
+
+import typer
+
+from wagents import ROOT
+from wagents.catalog import CatalogNode
+from wagents.commands.validate import run_python_script, validate_name
+from wagents.context import get_repo_root
+from wagents.docs import regenerate_sidebar_and_indexes
+from wagents.parsing import parse_frontmatter, to_title
+from wagents.rendering import scaffold_doc_page
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_AGENT_TEMPLATE = """---
+name: {name}
+description: TODO — When Claude should delegate to this agent
+
+# tools: Read, Glob, Grep, Bash            # Tool allowlist (inherits all if omitted)
+# disallowedTools: Write, Edit              # Tool denylist (removed from inherited set)
+# model: sonnet                             # Model: sonnet | opus | haiku | inherit
+# permissionMode: default                   # default | acceptEdits | delegate | dontAsk | bypassPermissions | plan
+# maxTurns: 50                              # Maximum agentic turns before stopping
+# skills:                                   # Skills preloaded into agent context
+#   - skill-name
+# mcpServers:                               # MCP servers available to this agent
+#   - server-name
+# memory: project                           # Persistent memory: user | project | local
+# hooks:                                    # Lifecycle hooks scoped to this agent
+#   PreToolUse:
+#     - matcher: Bash
+#       hooks: [{{command: "echo check"}}]
+---
+
+# {title}
+
+This is the agent's system prompt. Everything below the frontmatter
+is injected as instructions when this agent is spawned.
+
+## Capabilities
+
+Describe what this agent specializes in.
+
+## Guidelines
+
+Rules and constraints for this agent's behavior.
+"""
+
+_MCP_SERVER_TEMPLATE = '''"""MCP server: {name}."""
+
+from fastmcp import FastMCP
+
+mcp = FastMCP("{title}")
+
+
+@mcp.tool
+def hello(query: str) -> str:
+    """Example tool — replace with your implementation."""
+    return f"Hello from {name}: {{query}}"
+'''
+
+_MCP_PYPROJECT_TEMPLATE = """[project]
+name = "mcp-{name}"
+version = "0.1.0"
+description = "TODO — What this MCP server does"
+requires-python = ">=3.13"
+dependencies = ["fastmcp>=2"]
+
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+"""
+
+_FASTMCP_CONFIG_JSON = (
+    json.dumps(
+        {
+            "$schema": "https://gofastmcp.com/public/schemas/fastmcp.json/v1.json",
+            "source": {"path": "server.py", "entrypoint": "mcp"},
+            "environment": {"type": "uv"},
+        },
+        indent=2,
+    )
+    + "\n"
+)
+
+
+def _scaffold_docs(node: CatalogNode, root: Path) -> None:
+    """Scaffold *node*'s docs page and refresh hub pages.
+
+    Docs generation writes under the checkout wagents was imported from, so it is
+    skipped when the asset went to a different ``--repo-root``; the asset and its
+    page never land in different trees.
+    """
+    if root.resolve() != ROOT.resolve():
+        typer.echo(
+            f"Skipped docs scaffold: docs are generated under {ROOT}, not {root}. "
+            "Run `wagents docs generate` from that checkout.",
+            err=True,
+        )
+        return
+    scaffold_doc_page(node)
+    regenerate_sidebar_and_indexes()
+    typer.echo("Regenerated sidebar and index pages")
+
+
+def register_new_commands(new_app: typer.Typer) -> None:
+    """Register the skill, agent, and mcp scaffold commands on *new_app*."""
+
+    @new_app.command("skill")
+    def new_skill(
+        name: str,
+        no_docs: bool = typer.Option(False, "--no-docs", help="Skip docs page scaffold"),
+    ):
+        """Create a new skill from template."""
+        root = get_repo_root()
+        scaffold_script = root / "skills" / "skill-creator" / "scripts" / "scaffold_skill.py"
+        code = run_python_script(scaffold_script, [name])
+        if code != 0:
+            raise typer.Exit(code=code)
+        skill_file = root / "skills" / name / "SKILL.md"
+        content = skill_file.read_text()
+
+        if not no_docs:
+            fm, body = parse_frontmatter(content)
+            node = CatalogNode(
+                kind="skill",
+                id=name,
+                title=to_title(name),
+                description=str(fm.get("description", "")),
+                metadata=fm,
+                body=body,
+                source_path=f"skills/{name}/SKILL.md",
+            )
+            _scaffold_docs(node, root)
+
+    @new_app.command("agent")
+    def new_agent(
+        name: str,
+        no_docs: bool = typer.Option(False, "--no-docs", help="Skip docs page scaffold"),
+    ):
+        """Create a new agent from template."""
+        validate_name(name)
+        root = get_repo_root()
+        agents_dir = root / "agents"
+        agent_file = agents_dir / f"{name}.md"
+
+        if agent_file.exists():
+            typer.echo(f"Error: {agent_file} already exists", err=True)
+            raise typer.Exit(code=1)
+
+        agents_dir.mkdir(parents=True, exist_ok=True)
+
+        content = _AGENT_TEMPLATE.format(name=name, title=to_title(name))
+        agent_file.write_text(content)
+        typer.echo(f"Created agents/{name}.md")
+
+        if not no_docs:
+            fm, body = parse_frontmatter(content)
+            node = CatalogNode(
+                kind="agent",
+                id=name,
+                title=to_title(name),
+                description=str(fm.get("description", "")),
+                metadata=fm,
+                body=body,
+                source_path=f"agents/{name}.md",
+            )
+            _scaffold_docs(node, root)
+
+    @new_app.command("mcp")
+    def new_mcp(
+        name: str,
+        no_docs: bool = typer.Option(False, "--no-docs", help="Skip docs page scaffold"),
+    ):
+        """Create a new MCP server from template."""
+        validate_name(name)
+        root = get_repo_root()
+        mcp_dir = root / "mcp" / name
+
+        if mcp_dir.exists():
+            typer.echo(f"Error: {mcp_dir} already exists", err=True)
+            raise typer.Exit(code=1)
+
+        mcp_dir.mkdir(parents=True, exist_ok=True)
+
+        # Create server.py
+        server_content = _MCP_SERVER_TEMPLATE.format(name=name, title=to_title(name))
+        (mcp_dir / "server.py").write_text(server_content)
+
+        # Create pyproject.toml
+        (mcp_dir / "pyproject.toml").write_text(_MCP_PYPROJECT_TEMPLATE.format(name=name))
+
+        # Create fastmcp.json
+        (mcp_dir / "fastmcp.json").write_text(_FASTMCP_CONFIG_JSON)
+
+        # Update root pyproject.toml if needed
+        root_pyproject = root / "pyproject.toml"
+        content = root_pyproject.read_text()
+
+        workspace_member = f"mcp/{name}"
+        if "[tool.uv.workspace]" not in content:
+            if not content.endswith("\n"):
+                content += "\n"
+            content += f'\n[tool.uv.workspace]\nmembers = ["{workspace_member}"]\n'
+            root_pyproject.write_text(content)
+        elif f'"{workspace_member}"' not in content and f"'{workspace_member}'" not in content:
+            workspace_match = re.search(r"(?ms)^\[tool\.uv\.workspace\]\n(?P<body>.*?)(?=^\[|\Z)", content)
+            if workspace_match:
+                body = workspace_match.group("body")
+                members_match = re.search(r"(?ms)^members\s*=\s*\[(?P<members>.*?)\]", body)
+                if members_match:
+                    replacement = f"members = [{members_match.group('members').strip()}]"
+                    if members_match.group("members").strip():
+                        replacement = replacement[:-1] + f', "{workspace_member}"]'
+                    else:
+                        replacement = f'members = ["{workspace_member}"]'
+                    start = workspace_match.start("body") + members_match.start()
+                    end = workspace_match.start("body") + members_match.end()
+                    content = content[:start] + replacement + content[end:]
+                else:
+                    insert_at = workspace_match.start("body")
+                    content = content[:insert_at] + f'members = ["{workspace_member}"]\n' + content[insert_at:]
+                root_pyproject.write_text(content)
+
+        typer.echo(f"Created mcp/{name}/ with server.py, pyproject.toml, and fastmcp.json")
+
+        if not no_docs:
+            metadata = {
+                "project": {
+                    "name": f"mcp-{name}",
+                    "version": "0.1.0",
+                    "description": "TODO — What this MCP server does",
+                    "requires-python": ">=3.13",
+                    "dependencies": ["fastmcp>=2"],
+                },
+                "fastmcp_config": json.loads(_FASTMCP_CONFIG_JSON),
+            }
+            node = CatalogNode(
+                kind="mcp",
+                id=name,
+                title=to_title(name),
+                description="TODO — What this MCP server does",
+                metadata=metadata,
+                body=server_content,
+                source_path=f"mcp/{name}/server.py",
+            )
+            _scaffold_docs(node, root)
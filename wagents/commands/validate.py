@@ -21,7 +21,8 @@ def validate_name(name: str) -> None:
         raise typer.Exit(code=1)
 
 
-def _run_python_script(script, args: list[str]) -> int:
+def run_python_script(script, args: list[str]) -> int:
+    """Run *script* with the current interpreter from the repo root and relay its output."""
     repo_root = get_repo_root()
     result = subprocess.run(
         [sys.executable, str(script), *args],
@@ -55,7 +56,7 @@ def register_validate_commands(app: typer.Typer) -> None:
         """Validate all skills and agents."""
         script = resolve_repo_script("scripts/validate/validate_repo.py")
         raise typer.Exit(
-            code=_run_python_script(
+            code=run_python_script(
                 script,
                 ["--format", format_, "--repo-root", str(get_repo_root())],
             )
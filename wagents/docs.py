@@ -1,14 +1,18 @@
 """Documentation site generation: indexes, sidebar, and docs subcommands."""
 
 import fcntl
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, TypeVar, cast
 
@@ -19,7 +23,13 @@ from wagents import CONTENT_DIR, DOCS_DIR, ROOT
 
 # Authoring SSOT + catalog index (W3)
 from wagents.authoring_sync import sync_custom_authoring_from_skills
-from wagents.catalog import collect_edges
+from wagents.catalog import (
+    LOCAL_MCP_DIR_NAMES,
+    CatalogNode,
+    collect_edges,
+    group_edges_by_target,
+    index_nodes_by_key,
+)
 from wagents.docs_catalog import render_catalog_page_artifacts, write_catalog_pages
 from wagents.docs_reports import (
     reports_stale_reasons,
@@ -27,6 +37,7 @@ from wagents.docs_reports import (
     write_reports_pages,
 )
 from wagents.external_skills import ExternalSkillEntry, read_external_skill_entries
+from wagents.fs_digest import filesystem_digest
 from wagents.parsing import escape_attr, truncate_sentence
 from wagents.rendering import escape_mdx, render_page
 from wagents.site_model import (
@@ -81,6 +92,38 @@ T = TypeVar("T")
 # ---------------------------------------------------------------------------
 
 
+def _current_umask() -> int:
+    previous = os.umask(0)
+    os.umask(previous)
+    return previous
+
+
+# Mode a plain ``Path.write_text`` gives a new file; read once because os.umask
+# can only be queried by setting it.
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write *content* via a sibling temp file and rename, so watchers never see a partial file.
+
+    The payload is encoded once and written as bytes, which skips the text layer and
+    keeps generated files LF-only on every platform.
+    """
+    payload = content.encode("utf-8")
+    # Unique temp name so concurrent writers never share a file; NamedTemporaryFile
+    # creates it 0600, so restore the mode a plain write would have produced.
+    mode = path.stat().st_mode & 0o777 if path.exists() else _NEW_FILE_MODE
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        tmp_path.write_bytes(payload)
+        tmp_path.chmod(mode)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _count_mcp_servers_from_config() -> int | None:
     """Return the canonical MCP server count from the registry, if present."""
     mcp_config = ROOT / "config" / "mcp-registry.json"
@@ -205,19 +248,20 @@ def write_site_data(nodes: list, external_entries: list[ExternalSkillEntry] | No
         has_mcp_overview=_has_mcp_overview_page(),
         external_skills=external_entries,
     )
-    (DOCS_DIR / "src" / "generated-site-data.mjs").write_text(render_site_data_module(data), encoding="utf-8")
+    _write_text_atomic(DOCS_DIR / "src" / "generated-site-data.mjs", render_site_data_module(data))
     public_index_dir = DOCS_DIR / "public" / "generated-skill-indexes"
     public_index_dir.mkdir(parents=True, exist_ok=True)
     for stale in ("custom.json", "external.json", "all.json", "installed.json"):
         stale_path = public_index_dir / stale
         if stale_path.exists():
             stale_path.unlink()
-    (public_index_dir / "install-scripts.json").write_text(
-        json.dumps(data["skillInstallScripts"], indent=2, sort_keys=True), encoding="utf-8"
+    _write_text_atomic(
+        public_index_dir / "install-scripts.json",
+        json.dumps(data["skillInstallScripts"], indent=2, sort_keys=True),
     )
-    (DOCS_DIR / "src" / "generated-skill-indexes.mjs").write_text(render_skill_indexes_module(data), encoding="utf-8")
+    _write_text_atomic(DOCS_DIR / "src" / "generated-skill-indexes.mjs", render_skill_indexes_module(data))
     update_research_manifest()
-    (DOCS_DIR / "src" / "generated-visual-assets.css").write_text(render_visual_assets_css(), encoding="utf-8")
+    _write_text_atomic(DOCS_DIR / "src" / "generated-visual-assets.css", render_visual_assets_css())
 
 
 def public_landing_stats(counts: dict[str, int | str], *, mcps: list, has_mcp_overview: bool) -> list[str]:
@@ -305,12 +349,10 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
     parts.append("      link: /surfaces/")
     parts.append("      variant: minimal")
     parts.append("      icon: right-arrow")
-    parts.append("---")
-    parts.append("")
+    parts.append("---\n")
     parts.append("import { Badge, Card, CardGrid, LinkCard, Aside } from '@astrojs/starlight/components';")
     parts.append("import InstallCommand from '../../components/InstallCommand.astro';")
-    parts.append("import { installCommands } from '../../generated-site-data.mjs';")
-    parts.append("")
+    parts.append("import { installCommands } from '../../generated-site-data.mjs';\n")
 
     has_mcp_overview = _has_mcp_overview_page()
     counts = data["counts"]
@@ -344,11 +386,9 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
         '<img src="https://img.shields.io/github/v/release/wyattowalsh/agents?style=flat-square&color=0284c7" '
         'alt="Latest release" /></a>'
     )
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
 
-    parts.append("## Surface Map")
-    parts.append("")
+    parts.append("## Surface Map\n")
     parts.append(
         "A surface is a portable piece of agent configuration. `wagents` keeps each surface "
         "inspectable in the repo, then generates the runtime-specific files and docs around it."
@@ -387,11 +427,9 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
     parts.append("    <strong>Agents</strong>")
     parts.append(f"    <span>{bundled_agents} repo-managed specialist agent definitions.</span>")
     parts.append("  </a>")
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
 
-    parts.append("## Runtime Matrix")
-    parts.append("")
+    parts.append("## Runtime Matrix\n")
     parts.append(
         "Runtimes consume the same surfaces through native files, generated projections, "
         "plugins, MCPHub endpoints, or Skills CLI installs. The detailed fixture-backed matrix "
@@ -415,8 +453,7 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
         )
     parts.append("</tbody>")
     parts.append("</table>")
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
     parts.append('<div class="stats-bar stats-bar--context">')
     parts.append(f'  <span class="stat stat-harness">{supported_harnesses} Supported Runtimes</span>')
     parts.append(f'  <span class="stat stat-agent">{bundled_agents} Agent Definitions</span>')
@@ -424,13 +461,10 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
         parts.append(f'  <span class="stat stat-mcp">{custom_mcp} Repo MCP</span>')
     if has_mcp_overview and external_mcp:
         parts.append(f'  <span class="stat stat-mcp">{external_mcp} External MCP</span>')
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
 
-    parts.append("## Install Paths")
-    parts.append("")
-    parts.append("Choose the path by intent; each route links to the exact commands and generated references.")
-    parts.append("")
+    parts.append("## Install Paths\n")
+    parts.append("Choose the path by intent; each route links to the exact commands and generated references.\n")
     parts.append('<div class="install-path-grid">')
     parts.append('  <div class="operator-card">')
     parts.append('    <span class="operator-card__kicker">use everything</span>')
@@ -452,8 +486,7 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
     parts.append("    <h3>Validate generated surfaces</h3>")
     parts.append("    <p>Regenerate docs, validate registries, and run focused tests.</p>")
     parts.append("  </div>")
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
     parts.append(
         '<InstallCommand command={installCommands.all} title="Use everything" '
         'note="Global Skills CLI install across supported agent runtimes." />'
@@ -463,11 +496,9 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
     parts.append(_link_card("Install Guide", "/install/", "Intent-based install paths and preview commands."))
     parts.append(_link_card("Skill Install Scripts", "/skills/install/", "Copyable per-skill install commands."))
     parts.append(_link_card("CLI Reference", "/cli/", "Full wagents command reference."))
-    parts.append("</CardGrid>")
-    parts.append("")
+    parts.append("</CardGrid>\n")
 
-    parts.append("## Featured Workflows")
-    parts.append("")
+    parts.append("## Featured Workflows\n")
     parts.append(
         "Workflow cards are grouped by the surface they exercise so the catalog stays connected to the system model."
     )
@@ -515,8 +546,7 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
             "Use specialist agent definitions for focused review and coordination roles.",
         )
     )
-    parts.append("</CardGrid>")
-    parts.append("")
+    parts.append("</CardGrid>\n")
 
     parts.append('<Aside type="note" title="How these docs work">')
     if has_mcp_overview and not mcps and external_mcp:
@@ -537,12 +567,11 @@ def write_index_page(nodes: list, external_entries: list[ExternalSkillEntry] | N
             "Onboarding pages stay hand-maintained. "
             "See [Contributing](/contributing/) for CI/CD, generated artifact, and validation detail."
         )
-    parts.append("</Aside>")
-    parts.append("")
+    parts.append("</Aside>\n")
 
     content_dir = ROOT / "docs" / "src" / "content" / "docs"
     content_dir.mkdir(parents=True, exist_ok=True)
-    (content_dir / "index.mdx").write_text("\n".join(parts))
+    _write_text_atomic(content_dir / "index.mdx", "\n".join(parts))
 
 
 def write_install_page() -> None:
@@ -640,7 +669,7 @@ def write_install_page() -> None:
         "</CardGrid>",
         "",
     ]
-    (CONTENT_DIR / "install.mdx").write_text("\n".join(parts))
+    _write_text_atomic(CONTENT_DIR / "install.mdx", "\n".join(parts))
 
 
 def write_surfaces_pages(nodes: list) -> None:
@@ -685,7 +714,7 @@ def write_surfaces_pages(nodes: list) -> None:
         "</Aside>",
         "",
     ]
-    (out_dir / "index.mdx").write_text("\n".join(index))
+    _write_text_atomic(out_dir / "index.mdx", "\n".join(index))
 
     instructions = [
         "---",
@@ -733,7 +762,7 @@ def write_surfaces_pages(nodes: list) -> None:
         "</Aside>",
         "",
     ]
-    (out_dir / "instructions.mdx").write_text("\n".join(instructions))
+    _write_text_atomic(out_dir / "instructions.mdx", "\n".join(instructions))
 
     tools = [
         "---",
@@ -779,7 +808,7 @@ def write_surfaces_pages(nodes: list) -> None:
         "</Aside>",
         "",
     ]
-    (out_dir / "tools.mdx").write_text("\n".join(tools))
+    _write_text_atomic(out_dir / "tools.mdx", "\n".join(tools))
 
 
 def write_runtimes_page() -> None:
@@ -858,7 +887,7 @@ def write_runtimes_page() -> None:
         "</CardGrid>",
         "",
     ])
-    (CONTENT_DIR / "runtimes.mdx").write_text("\n".join(parts))
+    _write_text_atomic(CONTENT_DIR / "runtimes.mdx", "\n".join(parts))
 
 
 def write_reference_page() -> None:
@@ -898,7 +927,7 @@ def write_reference_page() -> None:
         "</Aside>",
         "",
     ]
-    (CONTENT_DIR / "reference.mdx").write_text("\n".join(parts))
+    _write_text_atomic(CONTENT_DIR / "reference.mdx", "\n".join(parts))
 
 
 def _accordionize_command_reference(parts: list[str]) -> list[str]:
@@ -931,1060 +960,61 @@ def _accordionize_command_reference(parts: list[str]) -> list[str]:
             continue
         if in_ref and line == "---" and in_details:
             out.append("</details>")
-            out.append("")
-            in_details = False
-            continue
-        out.append(line)
-    if in_details:
-        out.append("</details>")
-        out.append("")
-    return out
-
-
-def write_cli_page() -> None:
-    """Write the CLI reference page."""
-    parts = []
-    parts.append("---")
-    parts.append("title: CLI Reference")
-    parts.append("description: wagents CLI commands and usage")
-    parts.append("---")
-    parts.append("")
-    parts.append(
-        "import { Tabs, TabItem, Steps, FileTree, CardGrid, LinkCard, Aside, Badge }"
-        " from '@astrojs/starlight/components';"
-    )
-    parts.append(f"import harnessMatrixArt from '{_mdx_asset_import_path(VISUAL_ASSET_BY_ID['harness-matrix'].src)}';")
-    parts.append("")
-    parts.append(
-        "`wagents` is the repo control plane for skills, agents, MCP servers, and generated docs. "
-        "Use it to scaffold new assets, validate the repo, publish docs, and package skills for release."
-    )
-    parts.append("")
-    parts.append('<figure class="visual-panel">')
-    parts.append(
-        f'  <img src={{harnessMatrixArt.src}} alt="{escape_attr(VISUAL_ASSET_BY_ID["harness-matrix"].alt)}" />'
-    )
-    parts.append("  <figcaption>")
-    parts.append(f"    <strong>{escape_attr(VISUAL_ASSET_BY_ID['harness-matrix'].title)}</strong>")
-    parts.append(f"    <span>{escape_attr(VISUAL_ASSET_BY_ID['harness-matrix'].description)}</span>")
-    parts.append("  </figcaption>")
-    parts.append("</figure>")
-    parts.append("")
-    parts.append("## Boot Sequence")
-    parts.append("")
-    parts.append("### Global install (any directory)")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("uv tool install wagents --from git+https://github.com/wyattowalsh/agents")
-    parts.append("wagents self doctor")
-    parts.append("```")
-    parts.append("")
-    parts.append("Run repo-scoped commands inside a clone, or set `WAGENTS_REPO_ROOT` / `--repo-root`.")
-    parts.append("")
-    parts.append("### Contributor workflow (repository clone)")
-    parts.append("")
-    parts.append("<Steps>")
-    parts.append("")
-    parts.append("1. Sync the repo environment:")
-    parts.append("   ```bash")
-    parts.append("   uv sync")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("2. Sanity-check your toolchain:")
-    parts.append("   ```bash")
-    parts.append("   uv run wagents doctor")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("3. Validate the repo before making changes:")
-    parts.append("   ```bash")
-    parts.append("   uv run wagents validate")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("4. Start the docs site when you need to inspect generated output:")
-    parts.append("   ```bash")
-    parts.append("   uv run wagents docs dev")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("</Steps>")
-    parts.append("")
-    parts.append('<Aside type="tip" title="Running commands">')
-    parts.append(
-        "Examples below omit the `uv run` prefix for brevity. "
-        "Use `wagents ...` after `uv tool install`, or `uv run wagents ...` from a clone."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("## Command Map")
-    parts.append("")
-    parts.append("| Command | Description |")
-    parts.append("|---------|-------------|")
-    parts.append("| `wagents new <asset>` | Scaffold a new skill, agent, or MCP server from repo templates |")
-    parts.append("| `wagents validate` | Check frontmatter, naming, hooks, and related-skill integrity |")
-    parts.append("| `wagents doctor` | Sanity-check Python, uv, Node tooling, docs deps, and Playwright |")
-    parts.append("| `wagents self <subcommand>` | Install, upgrade, and diagnose the global wagents binary |")
-    parts.append("| `wagents readme` | Regenerate `README.md` or fail if it is stale |")
-    parts.append(
-        "| `wagents openspec <subcommand>` | Inspect, validate, and materialize OpenSpec workflows for "
-        "downstream AI tools |"
-    )
-    parts.append("| `wagents install` | Install repo skills into supported agent platforms |")
-    parts.append("| `wagents update` | Refresh installed skills from their recorded sources |")
-    parts.append(
-        "| `wagents skills <subcommand>` | Inventory, sync, search, read, and diagnose local skills on demand |"
-    )
-    parts.append("| `wagents package <name>` | Build portable ZIP packages for sharing or release |")
-    parts.append("| `wagents docs <subcommand>` | Generate, serve, build, preview, or clean the docs site |")
-    parts.append("| `wagents hooks <subcommand>` | List and validate lifecycle hooks |")
-    parts.append("| `wagents eval <subcommand>` | List, validate, and check eval coverage |")
-    parts.append("| `wagents media <subcommand>` | Image optimize and related media helpers |")
-    parts.append("| `wagents rtk <subcommand>` | RTK shell-token doctor, sync preview, and gain reports |")
-    parts.append("| `wagents apm <subcommand>` | APM materialize/compile helpers for portable projections |")
-    parts.append("| `wagents opencode <subcommand>` | OpenCode session/config operator helpers |")
-    parts.append("| `wagents catalog <subcommand>` | Catalog index and inventory checks |")
-    parts.append("| `wagents grok <subcommand>` | Grok doctor, Plannotator install/sync, harness helpers |")
-    parts.append("")
-    parts.append("## Command Reference")
-    parts.append("")
-
-    # --- wagents new ---
-    parts.append("### `wagents new` -- Create Assets")
-    parts.append("")
-    parts.append(
-        "Scaffold new skills, agents, or MCP servers from reference templates. "
-        "Each template includes commented examples for all optional fields."
-    )
-    parts.append("")
-    parts.append("<Tabs>")
-    parts.append('  <TabItem label="skill">')
-    parts.append("")
-    parts.append("Create a new skill with YAML frontmatter and markdown body:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents new skill my-skill")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "This creates `skills/my-skill/SKILL.md` with a complete template "
-        "including all optional frontmatter fields as comments, and scaffolds a documentation page."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Skip the docs page scaffold")
-    parts.append("wagents new skill my-skill --no-docs")
-    parts.append("```")
-    parts.append("")
-    parts.append("**Output structure:**")
-    parts.append("```")
-    parts.append("skills/my-skill/")
-    parts.append("  SKILL.md          # Frontmatter + instructions")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="agent">')
-    parts.append("")
-    parts.append("Create a new agent configuration:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents new agent my-agent")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "This creates `agents/my-agent.md` with frontmatter for tools, permissions, "
-        "model selection, and a system prompt body."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Skip the docs page scaffold")
-    parts.append("wagents new agent my-agent --no-docs")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="mcp">')
-    parts.append("")
-    parts.append("Create a new MCP server with FastMCP v3:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents new mcp my-server")
-    parts.append("```")
-    parts.append("")
-    parts.append("This creates a complete MCP server directory:")
-    parts.append("")
-    parts.append("```")
-    parts.append("mcp/my-server/")
-    parts.append("  server.py         # FastMCP entry point with example tool")
-    parts.append("  pyproject.toml    # Package config with fastmcp>=2 dependency")
-    parts.append("  fastmcp.json      # FastMCP configuration")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "The command also adds the exact `mcp/<name>` entry to the uv workspace in `pyproject.toml` "
-        "if not already present."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Skip the docs page scaffold")
-    parts.append("wagents new mcp my-server --no-docs")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append("</Tabs>")
-    parts.append("")
-    parts.append('<Aside type="note" title="Naming rules">')
-    parts.append(
-        "All asset names must be kebab-case (`^[a-z0-9][a-z0-9-]*$`) "
-        "and at most 64 characters. The name must match the directory name "
-        "(for skills and MCP servers) or filename (for agents)."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents openspec ---
-    parts.append("### `wagents openspec` -- Spec Workflow Control")
-    parts.append("")
-    parts.append(
-        "Wrap OpenSpec CLI commands with repo defaults, downstream tool mappings, and `OPENSPEC_TELEMETRY=0` "
-        "for automation. Use these wrappers when AI agents need JSON status or instructions."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents openspec doctor")
-    parts.append("wagents openspec init --apply")
-    parts.append("wagents openspec status --change add-feature --format json")
-    parts.append("wagents openspec instructions design --change add-feature --format json")
-    parts.append("wagents openspec validate")
-    parts.append("```")
-    parts.append("")
-    parts.append("**Subcommands:**")
-    parts.append("")
-    parts.append("| Command | Purpose |")
-    parts.append("|---------|---------|")
-    parts.append("| `doctor` | Check Node, npx, OpenSpec project files, generated artifacts, and tool mapping |")
-    parts.append("| `init` | Print or run `openspec init` for repo-supported downstream tools |")
-    parts.append("| `update` | Print or run `openspec update` after CLI/profile changes |")
-    parts.append("| `validate` | Run `openspec validate --all --strict --json` |")
-    parts.append("| `status` | Return artifact state for one change as JSON-compatible output |")
-    parts.append("| `instructions` | Return artifact or apply instructions as JSON-compatible output |")
-    parts.append("| `schemas` | List available OpenSpec schemas |")
-    parts.append("")
-    parts.append('<Aside type="note" title="Generated OpenSpec artifacts">')
-    parts.append(
-        "OpenSpec-generated `.claude`, `.cursor`, `.opencode`, `.github`, `.agent`, `.crush`, `.codex`, "
-        "and `.gemini` artifacts are local/generated unless a specific file is promoted to repo-owned source."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents validate ---
-    parts.append("### `wagents validate` -- Check All Assets")
-    parts.append("")
-    parts.append(
-        "Validate frontmatter and structure for every skill, agent, and MCP server in the repository. "
-        "Also validates hook registry, harness paths, and lifecycle event names via "
-        "`scripts/validate/validate_repo.py`."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents validate")
-    parts.append("")
-    parts.append("# Output as JSON or JSONL")
-    parts.append("wagents validate --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append("**What it checks:**")
-    parts.append("")
-    parts.append("| Asset type | Validations |")
-    parts.append("|-----------|-------------|")
-    parts.append(
-        "| **Skills** | Required `name` and `description` fields, kebab-case naming, "
-        "name matches directory, description within 1024 chars, body is non-empty |"
-    )
-    parts.append("| **Agents** | Required `name` and `description` fields, kebab-case naming, name matches filename |")
-    parts.append(
-        "| **MCP servers** | Directory is kebab-case, `server.py` exists and references FastMCP, "
-        "`pyproject.toml` includes fastmcp dependency, `fastmcp.json` exists |"
-    )
-    parts.append(
-        "| **Hooks** | Registry entries, runner paths, harness coverage, and known lifecycle events "
-        "across skills, agents, and settings |"
-    )
-    parts.append("")
-    parts.append("The command exits with code 1 if any validation fails, printing each error to stdout.")
-    parts.append("")
-    parts.append('<Aside type="tip" title="CI integration">')
-    parts.append(
-        "Run `wagents validate` in your CI pipeline to catch frontmatter issues before merge. "
-        "It is included in the repository's pre-commit and CI checks."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents doctor ---
-    parts.append("### `wagents doctor` -- Environment Health Check")
-    parts.append("")
-    parts.append(
-        "Diagnose your local environment and toolchain. Checks for required tools, "
-        "correct Python version, docs dependency status, and Playwright availability."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents doctor")
-    parts.append("")
-    parts.append("# Output as JSON for scripting")
-    parts.append("wagents doctor --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append("**What it checks:**")
-    parts.append("")
-    parts.append("| Check | Status on failure |")
-    parts.append("|-------|-------------------|")
-    parts.append("| Python version satisfies `requires-python` | `fail` |")
-    parts.append("| `uv` on PATH | `fail` |")
-    parts.append("| `node`, `npx`, `pnpm` on PATH | `warn` |")
-    parts.append("| `docs/node_modules` present and fresh | `warn` |")
-    parts.append("| Playwright Python package installed | `warn` |")
-    parts.append("| Playwright browser cache exists | `warn` |")
-    parts.append("")
-    parts.append(
-        "Exits with code 1 if any check has `fail` status. Warnings are informational and do not affect the exit code."
-    )
-    parts.append("")
-    parts.append('<Aside type="tip" title="First-time setup">')
-    parts.append("Run `wagents doctor` after cloning to verify your environment before working with skills or docs.")
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents readme ---
-    parts.append("### `wagents readme` -- Generate README")
-    parts.append("")
-    parts.append(
-        "Regenerate `README.md` from the current repository contents, or check if the existing README is up to date:"
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Fully regenerate README.md")
-    parts.append("wagents readme")
-    parts.append("")
-    parts.append("# Check if README is stale (exits 1 if out of date)")
-    parts.append("wagents readme --check")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "The generated README includes tables for all skills, agents, and MCP servers, "
-        "plus a development commands reference."
-    )
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents install ---
-    parts.append("### `wagents install` -- Install Skills")
-    parts.append("")
-    parts.append("Install skills into agent platforms via `npx skills`:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Install all skills to all supported agents globally")
-    parts.append("wagents install")
-    parts.append("")
-    parts.append("# Install specific skill(s)")
-    parts.append("wagents install my-skill")
-    parts.append("")
-    parts.append("# Install to a specific agent")
-    parts.append("wagents install -a claude-code")
-    parts.append("")
-    parts.append("# Project-local install instead of global")
-    parts.append("wagents install --local")
-    parts.append("")
-    parts.append("# List available skills without installing")
-    parts.append("wagents install --list")
-    parts.append("")
-    parts.append("# Copy files instead of symlinking")
-    parts.append("wagents install --copy")
-    parts.append("")
-    parts.append("# Skip confirmation prompts")
-    parts.append("wagents install -y")
-    parts.append("```")
-    parts.append("")
-    parts.append("For third-party skill sources or curated subsets, use `npx skills add` directly:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append(f"npx skills add <source> --skill <name> -y -g {agent_flags()}")
-    parts.append("```")
-    parts.append("")
-    parts.append("| Option | Default | Description |")
-    parts.append("|--------|---------|-------------|")
-    parts.append("| `<skills>` | all | Positional skill name(s) to install |")
-    parts.append("| `-a`, `--agent` | all | Target agent(s), repeatable |")
-    parts.append("| `-g`, `--global` | `true` | Install globally (default) |")
-    parts.append("| `--local` | `false` | Install into current project only |")
-    parts.append("| `--list` | `false` | List available skills without installing |")
-    parts.append("| `--copy` | `false` | Copy files instead of symlinking |")
-    parts.append("| `-y`, `--yes` | `false` | Skip confirmation prompts |")
-    parts.append("")
-    parts.append("**Supported agents:** `claude-code`, `codex`, `crush`, `cursor`, `grok`, `opencode`")
-    parts.append("")
-    parts.append('<Aside type="note" title="Grok Build install alias">')
-    parts.append(
-        "Skills CLI has no native `grok` adapter. `wagents install -a grok` and "
-        "`wagents skills sync -a grok` install via the `claude-code` adapter, then "
-        "mirror missing skills into `~/.grok/skills`."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-    parts.append("### `wagents grok plannotator install` -- Plannotator for Grok")
-    parts.append("")
-    parts.append(
-        "Install the Plannotator CLI, core slash skills, optional extras, mirror into `~/.grok/skills`, "
-        "and sync repo-managed plan-review hooks to `~/.grok/hooks/plannotator.json`. "
-        "Grok has no npm plugin like OpenCode's `@plannotator/opencode`."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents grok plannotator install")
-    parts.append("wagents grok plannotator install --no-extras --no-hooks")
-    parts.append("wagents grok plannotator sync")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "Grok home sync enables Plannotator hooks and skill overlays by default. "
-        "Pass `--no-plannotator-hooks` to `sync_agent_stack.py` to skip hook refresh."
-    )
-    parts.append("")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-    parts.append("### `wagents grok doctor` -- Grok Build diagnostics")
-    parts.append("")
-    parts.append(
-        "Report Grok config paths, managed MCP/policy blocks, experimental env vars, skill roots, "
-        "and Plannotator binary/skills/hooks status:"
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents grok doctor")
-    parts.append("wagents grok doctor --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append("Source optional env defaults before sessions:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("source config/grok-env.sh")
-    parts.append("```")
-    parts.append("")
-    parts.append("Isolated home sync (skips OpenCode and other harness home merges):")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("uv run python scripts/sync_agent_stack.py --apply --platforms grok --targets home")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "Repo-owned policy lives in `config/grok-config.toml`; project MCP projection is "
-        "`.grok/config.toml`; full home merge targets `~/.grok/config.toml`. Blend-owned "
-        "tables (`ui`, `features`, etc.) keep user-only keys while repo policy overrides shared keys."
-    )
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents update ---
-    parts.append("### `wagents update` -- Refresh Installed Skills")
-    parts.append("")
-    parts.append(
-        "Refresh installed skills from the sources recorded by the `skills` CLI. "
-        "Use this after this repository changes so downstream agent installs pick up the latest committed skill files."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents update")
-    parts.append("")
-    parts.append("# Equivalent lower-level command")
-    parts.append("npx skills update")
-    parts.append("```")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents skills sync ---
-    parts.append("### `wagents skills sync` -- Additive Cross-Harness Sync")
-    parts.append("")
-    parts.append(
-        "Build a normalized installed-skill inventory from `npx skills ls -g -a <agent> --json`, "
-        "then preview or apply additive installs for the desired sync set."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Default mode is dry-run across all supported harnesses")
-    parts.append("wagents skills sync")
-    parts.append("")
-    parts.append("# Target one harness")
-    parts.append("wagents skills sync --agent codex")
-    parts.append("")
-    parts.append("# Include verified one-off installed external skills")
-    parts.append("wagents skills sync --include-installed")
-    parts.append("")
-    parts.append("# Execute the verified install commands")
-    parts.append("wagents skills sync --apply")
-    parts.append("```")
-    parts.append("")
-    parts.append("| Option | Default | Description |")
-    parts.append("|--------|---------|-------------|")
-    parts.append("| `-a`, `--agent` | all | Restrict sync to one or more harnesses |")
-    parts.append("| `--all-agents` | `false` | Explicitly target all supported harnesses |")
-    parts.append(
-        "| `--dry-run` | `true` | Preview missing, already-present, unresolved, "
-        "skipped rows, and exact install commands |"
-    )
-    parts.append("| `--apply` | `false` | Execute only the verified additive install commands |")
-    parts.append(
-        "| `--include-installed` | `false` | Include verified one-off installed "
-        "external skills outside the curated desired set |"
-    )
-    parts.append("")
-    parts.append('<Aside type="note" title="Desired sync set">')
-    parts.append(
-        "By default, sync targets repo-owned custom skills plus verified curated external skills. "
-        "It never removes user-installed skills."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append('<Aside type="tip" title="Inventory fallback">')
-    parts.append(
-        "When a Skills CLI inventory query fails, times out, or emits unusable JSON for a harness "
-        "with a known local skill root, dry-run reports may continue from a read-only local "
-        "`SKILL.md` scan. The report prints a warning whenever fallback evidence is used."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents skills cleanup ---
-    parts.append("### `wagents skills cleanup` -- Duplicate Exposure Planner")
-    parts.append("")
-    parts.append(
-        "Read-only inventory of duplicate skill/plugin exposures across local harnesses. "
-        "Pair with [`plugin-skill-ownership`](/harness-config/plugin-skill-ownership/) before changing home configs."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents skills cleanup --dry-run --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append('<Aside type="caution" title="Dry-run only">')
-    parts.append(
-        "`wagents skills cleanup` and `skills cleanup` remain preview-only until a reviewed apply manifest exists. "
-        "Use `wagents skills sync --apply` only after reviewing dry-run output."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents catalog ---
-    parts.append("### `wagents catalog` -- Catalog SSOT Checks")
-    parts.append("")
-    parts.append(
-        "Inspect the source-authored skill catalog and generated index without installing external skills. "
-        "`audit` measures curated external evidence gaps; it is read-only and exits zero by default so teams can "
-        "plan remediation before enabling strict gates."
-    )
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents catalog index --check")
-    parts.append("wagents catalog audit")
-    parts.append("wagents catalog audit --status install-now-after-trust-gate --format json")
-    parts.append("wagents catalog audit --strict")
-    parts.append("```")
-    parts.append("")
-    parts.append("| Command | Purpose |")
-    parts.append("|---------|---------|")
-    parts.append("| `index --check` | Fail when the committed catalog index is stale relative to authoring MDX |")
-    parts.append(
-        "| `audit` | Report missing license, pin, source-list, executable-surface, "
-        "credential, live-action, and dedupe evidence |"
-    )
-    parts.append("| `audit --strict` | Exit nonzero when warning or error audit issues are present |")
-    parts.append("| `sync-authoring` | Project repo-owned `skills/*/SKILL.md` into custom authoring MDX |")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents skills ---
-    parts.append("### `wagents skills` -- On-Demand Skill Index")
-    parts.append("")
-    parts.append(
-        "Inspect repository, installed, curated, and plugin skills without loading every skill description "
-        "into startup context. Use this when local skill inventory exceeds an agent's context budget or when you "
-        "need additive sync diagnostics."
-    )
-    parts.append("")
-    parts.append("<Tabs>")
-    parts.append('  <TabItem label="sync">')
-    parts.append("")
-    parts.append("Preview additive cross-harness installs from the normalized inventory:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents skills sync --dry-run")
-    parts.append("")
-    parts.append("# Narrow to one harness and include verified one-off installs")
-    parts.append("wagents skills sync --agent codex --include-installed")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="search">')
-    parts.append("")
-    parts.append("Search for matching skills with deterministic lexical ranking:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append('wagents skills search "fix GitHub Actions workflow"')
-    parts.append("")
-    parts.append("# Restrict to repo skills and emit JSON")
-    parts.append('wagents skills search "release notes" --source repo --format json')
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="context">')
-    parts.append("")
-    parts.append("Build a compact context packet from the top matching skill bodies:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append('wagents skills context "debug browser rendering" --limit 3')
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="read">')
-    parts.append("")
-    parts.append("Read one known skill by exact name or path:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents skills read skill-router")
-    parts.append("wagents skills read /path/to/SKILL.md")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="doctor">')
-    parts.append("")
-    parts.append("Inspect skill roots, counts, and warning totals:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents skills doctor")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append("</Tabs>")
-    parts.append("")
-    parts.append("| Source | Roots |")
-    parts.append("|--------|-------|")
-    parts.append("| `repo` | `skills/` |")
-    parts.append("| `project` | `.agents/skills/` in the current project path |")
-    parts.append("| `codex` | `~/.codex/skills/` |")
-    parts.append("| `global` | `~/.agents/skills/` plus supported agent skill stores |")
-    parts.append("| `plugin` | `~/.codex/plugins/cache/**/skills/` |")
-    parts.append("")
-    parts.append("Each result includes `name`, `path`, `source`, `trust_tier`, `score`, matched fields, and warnings.")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-
-    # --- wagents package ---
-    parts.append("### `wagents package` -- Package Skills")
-    parts.append("")
-    parts.append("Package skills into portable ZIP files for distribution:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Package a single skill")
-    parts.append("wagents package my-skill")
-    parts.append("")
-    parts.append("# Package all skills")
-    parts.append("wagents package --all")
-    parts.append("")
-    parts.append("# Check portability without creating ZIPs")
-    parts.append("wagents package --dry-run")
-    parts.append("")
-    parts.append("# Specify output directory")
-    parts.append("wagents package my-skill --output dist/")
-    parts.append("")
-    parts.append("# Output as JSON instead of table")
-    parts.append("wagents package my-skill --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "Packaged ZIPs are self-contained and can be distributed independently or attached to GitHub releases."
-    )
-    parts.append("")
-    parts.append('<Aside type="note" title="Automated releases">')
-    parts.append(
-        "The `release-skills.yml` CI workflow automatically packages and releases "
-        "all skills when a version tag (`v*.*.*`) is pushed."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
+            out.append("")
+            in_details = False
+            continue
+        out.append(line)
+    if in_details:
+        out.append("</details>")
+        out.append("")
+    return out
 
-    # --- wagents docs ---
-    parts.append("### `wagents docs` -- Documentation Site")
-    parts.append("")
-    parts.append(
-        "Manage the [Starlight](https://starlight.astro.build/)-powered documentation site "
-        "at [agents.w4w.dev](https://agents.w4w.dev)."
-    )
-    parts.append("")
-    parts.append("<Tabs>")
-    parts.append('  <TabItem label="init">')
-    parts.append("")
-    parts.append("One-time setup to install documentation dependencies:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents docs init")
-    parts.append("```")
-    parts.append("")
-    parts.append("This runs `pnpm install` in the `docs/` directory.")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="generate">')
-    parts.append("")
-    parts.append("Generate MDX content pages, sidebar, and index pages from repository assets:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents docs generate")
-    parts.append("```")
-    parts.append("")
-    parts.append("**Options:**")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Default: repository-only catalog (CI parity)")
-    parts.append("wagents docs generate --no-installed")
-    parts.append("")
-    parts.append(
-        "# Include installed skills from local agent skill directories "
-        "(~/.config/opencode/skills/, ~/.agents/skills/, ~/.claude/skills/)"
-    )
-    parts.append("wagents docs generate --include-installed")
-    parts.append("")
-    parts.append("# Include skills with TODO descriptions")
-    parts.append("wagents docs generate --include-drafts")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "By default, generation is deterministic and repository-only (`--no-installed`). "
-        "Opt in with `--include-installed` for local harness inventory rows. The generator creates "
-        "individual pages for each skill, agent, and MCP server, plus category index pages "
-        "and the sidebar navigation."
-    )
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="dev">')
-    parts.append("")
-    parts.append("Generate content and start the development server with hot reload:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents docs dev")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="build">')
-    parts.append("")
-    parts.append("Generate content and produce a static build:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents docs build")
-    parts.append("```")
-    parts.append("")
-    parts.append("Output goes to `docs/dist/`.")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="preview">')
-    parts.append("")
-    parts.append("Generate, build, and start a preview server for the production build:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents docs preview")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="clean">')
-    parts.append("")
-    parts.append("Remove generated content pages while preserving hand-maintained files:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents docs clean")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "Intentional hand hubs (`start-here`, `hooks/index`, `mcp/index`, harness-config prose) "
-        "with `HAND-MAINTAINED` are preserved. Catalog *detail* pages under "
-        "`skills/catalog/{custom,external}/`, `agents/`, and `mcp/` always regenerate from SSOT "
-        "and are cleaned even if marked composed."
-    )
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append("</Tabs>")
-    parts.append("")
-    parts.append('<Aside type="tip" title="Typical docs workflow">')
-    parts.append(
-        "For day-to-day development, `wagents docs dev` is the most common command "
-        "-- it regenerates all content and launches a hot-reloading dev server in one step."
-    )
-    parts.append("</Aside>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
 
-    # --- wagents hooks ---
-    parts.append("### `wagents hooks` -- Lifecycle Hooks")
-    parts.append("")
-    parts.append(
-        "Inspect and validate lifecycle hooks defined in `.claude/settings.json`, "
-        "skill frontmatter, agent frontmatter, and the portable `config/hook-registry.json`."
-    )
-    parts.append("")
-    parts.append("<Tabs>")
-    parts.append('  <TabItem label="list">')
-    parts.append("")
-    parts.append("List all hooks across skills, agents, settings, and the portable hook registry:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents hooks list")
-    parts.append("")
-    parts.append("# Output as JSON")
-    parts.append("wagents hooks list --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append("Shows source, event, matcher, harness support, handler type, and command/prompt for each hook.")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="validate">')
-    parts.append("")
-    parts.append("Validate hook definitions for correct structure and known event names:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("# Fleet gate (default harness filter is all)")
-    parts.append("wagents hooks validate --harness all")
-    parts.append("")
-    parts.append("# Single harness projection check")
-    parts.append("wagents hooks validate --harness cursor")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "Checks that every hook event is a known lifecycle event (`PreToolUse`, `PostToolUse`, etc.), "
-        "handler types are valid (`command`, `prompt`, `agent`), registry harnesses are supported, "
-        "and required fields are present. Prefer `--harness all` in maintainer checklists so "
-        "per-harness projection failures are not missed."
-    )
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append("</Tabs>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
+CLI_REFERENCE_TEMPLATE_PATH = Path(__file__).resolve().parent / "data" / "cli-reference.mdx"
 
-    # --- wagents eval ---
-    parts.append("### `wagents eval` -- Skill Evals")
-    parts.append("")
-    parts.append(
-        "Manage and validate eval files stored in `skills/<name>/evals/*.json`. "
-        "Evals define test queries and expected behaviors for skills."
-    )
-    parts.append("")
-    parts.append("<Tabs>")
-    parts.append('  <TabItem label="list">')
-    parts.append("")
-    parts.append("List all eval files grouped by skill:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents eval list")
-    parts.append("")
-    parts.append("# Output as JSON")
-    parts.append("wagents eval list --format json")
-    parts.append("```")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="validate">')
-    parts.append("")
-    parts.append("Validate eval JSON files for required fields and referential integrity:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents eval validate")
-    parts.append("```")
-    parts.append("")
-    parts.append(
-        "Legacy scenario files must contain `skills`, `query`, and `expected_behavior`. "
-        "Canonical manifests may use `evals/evals.json` with `skill_name` plus an `evals` array "
-        "of cases containing `prompt` and `expected_output`, with optional `files` and `assertions`. "
-        "Canonical case prompts must be unique after trimming surrounding whitespace."
-    )
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append('  <TabItem label="coverage">')
-    parts.append("")
-    parts.append("Show which skills have evals and how many:")
-    parts.append("")
-    parts.append("```bash")
-    parts.append("wagents eval coverage")
-    parts.append("```")
-    parts.append("")
-    parts.append("Useful for identifying skills that lack test coverage.")
-    parts.append("")
-    parts.append("  </TabItem>")
-    parts.append("</Tabs>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
 
-    # --- Structured output ---
-    parts.append('### Structured Output <Badge text="All validation commands" variant="note" />')
-    parts.append("")
-    parts.append("Most inspection and validation commands accept `--format` to control output:")
-    parts.append("")
-    parts.append("| Format | Description |")
-    parts.append("|--------|-------------|")
-    parts.append("| `text` | Human-readable table output (default) |")
-    parts.append("| `json` | Single JSON object with full results |")
-    parts.append("| `jsonl` | One JSON object per line — ideal for piping to `jq` or log aggregators |")
-    parts.append("")
-    parts.append(
-        "Commands supporting `--format`: `validate`, `doctor`, `hooks list`, "
-        "`hooks validate`, `eval list`, `eval validate`, `eval coverage`, "
-        "`skills index`, `skills search`, `skills read`, `skills context`, `skills doctor`."
-    )
-    parts.append("")
-    parts.append("---")
-    parts.append("")
+@lru_cache(maxsize=1)
+def _cli_reference_template() -> str:
+    """Read the CLI reference body once and fold command sections into details blocks."""
+    text = CLI_REFERENCE_TEMPLATE_PATH.read_text(encoding="utf-8").removesuffix("\n")
+    return "\n".join(_accordionize_command_reference(text.split("\n")))
 
-    # --- Common Workflows ---
-    parts.append("## Common Workflows")
-    parts.append("")
-    parts.append("### Adding a new skill end-to-end")
-    parts.append("")
-    parts.append("<Steps>")
-    parts.append("")
-    parts.append("1. Scaffold the skill:")
-    parts.append("   ```bash")
-    parts.append("   wagents new skill my-skill")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("2. Edit `skills/my-skill/SKILL.md` with your instructions.")
-    parts.append("")
-    parts.append("3. Validate the frontmatter:")
-    parts.append("   ```bash")
-    parts.append("   wagents validate")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("4. Preview the docs page:")
-    parts.append("   ```bash")
-    parts.append("   wagents docs dev")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("5. Package for distribution:")
-    parts.append("   ```bash")
-    parts.append("   wagents package my-skill")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("</Steps>")
-    parts.append("")
-    parts.append("### Updating documentation after changes")
-    parts.append("")
-    parts.append("<Steps>")
-    parts.append("")
-    parts.append("1. Regenerate all docs:")
-    parts.append("   ```bash")
-    parts.append("   wagents docs generate")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("2. Rebuild the README:")
-    parts.append("   ```bash")
-    parts.append("   wagents readme")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("3. Run validation:")
-    parts.append("   ```bash")
-    parts.append("   wagents validate")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("</Steps>")
-    parts.append("")
-    parts.append("### Checking environment health")
-    parts.append("")
-    parts.append("<Steps>")
-    parts.append("")
-    parts.append("1. Run the doctor check:")
-    parts.append("   ```bash")
-    parts.append("   wagents doctor")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("2. Fix any `FAIL` items shown in the output.")
-    parts.append("")
-    parts.append("3. Run validation and hook checks:")
-    parts.append("   ```bash")
-    parts.append("   wagents validate && wagents hooks validate")
-    parts.append("   ```")
-    parts.append("")
-    parts.append("</Steps>")
-    parts.append("")
-    parts.append("---")
-    parts.append("")
 
-    # --- Repository Structure ---
-    parts.append("## Repository Structure")
-    parts.append("")
-    parts.append("<FileTree>")
-    parts.append("- skills/")
-    parts.append("  - \\<name>/")
-    parts.append("    - SKILL.md")
-    parts.append("    - references/ (optional)")
-    parts.append("    - scripts/ (optional)")
-    parts.append("    - evals/ (optional)")
-    parts.append("- agents/")
-    parts.append("  - \\<name>.md")
-    parts.append("- mcp/")
-    parts.append("  - \\<name>/")
-    parts.append("    - server.py")
-    parts.append("    - pyproject.toml")
-    parts.append("    - fastmcp.json")
-    parts.append("  - servers/ (ignored local third-party installs)")
-    parts.append("- docs/ (this site)")
-    parts.append("  - src/")
-    parts.append("    - content/")
-    parts.append("      - docs/ (generated MDX pages)")
-    parts.append("    - generated-sidebar.mjs")
-    parts.append("- wagents/")
-    parts.append("  - \\_\\_init\\_\\_.py")
-    parts.append("  - cli.py")
-    parts.append("  - parsing.py")
-    parts.append("  - catalog.py")
-    parts.append("  - rendering.py")
-    parts.append("  - docs.py")
-    parts.append("- tests/")
-    parts.append("</FileTree>")
-    parts.append("")
-    parts.append("## See also")
-    parts.append("")
-    parts.append("<CardGrid>")
-    parts.append('  <LinkCard title="Install" href="/install/" description="Choose an install path." />')
-    parts.append(
-        '  <LinkCard title="Skill Catalog" href="/skills/catalog/" description="Browse installable skills." />'
-    )
-    parts.append(
-        '  <LinkCard title="Bundle Manifest" href="https://github.com/wyattowalsh/agents/blob/main/agent-bundle.json" '
-        'description="current bundle surface and generated docs inputs." />'
-    )
-    parts.append("</CardGrid>")
-    parts.append("")
-    parts = _accordionize_command_reference(parts)
+def _cli_reference_body() -> str:
+    """Return the static CLI reference body that follows the hero figure.
+
+    The body lives in ``wagents/data/cli-reference.mdx`` and is read once per
+    process; ``%AGENT_FLAGS%`` is the only substitution.
+    """
+    return _cli_reference_template().replace("%AGENT_FLAGS%", agent_flags())
+
+
+def write_cli_page() -> None:
+    """Write the CLI reference page."""
+    art = VISUAL_ASSET_BY_ID["harness-matrix"]
+    header = f"""---
+title: CLI Reference
+description: wagents CLI commands and usage
+---
+
+import {{ Tabs, TabItem, Steps, FileTree, CardGrid, LinkCard, Aside, Badge }} from '@astrojs/starlight/components';
+import harnessMatrixArt from '{_mdx_asset_import_path(art.src)}';
+
+`wagents` is the repo control plane for skills, agents, MCP servers, and generated docs. \
+Use it to scaffold new assets, validate the repo, publish docs, and package skills for release.
+
+<figure class="visual-panel">
+  <img src={{harnessMatrixArt.src}} alt="{escape_attr(art.alt)}" />
+  <figcaption>
+    <strong>{escape_attr(art.title)}</strong>
+    <span>{escape_attr(art.description)}</span>
+  </figcaption>
+</figure>
+"""
 
     content_dir = ROOT / "docs" / "src" / "content" / "docs"
     content_dir.mkdir(parents=True, exist_ok=True)
-    (content_dir / "cli.mdx").write_text("\n".join(parts))
+    _write_text_atomic(content_dir / "cli.mdx", header + _cli_reference_body())
 
 
 # ---------------------------------------------------------------------------
@@ -2006,6 +1036,16 @@ def _skill_id_is_linkable(skill_id: str) -> bool:
     return _LINKABLE_SKILL_ID.fullmatch(skill_id) is not None
 
 
+def _partition_nodes(nodes: list) -> tuple[list, list, list]:
+    """Split *nodes* into (skills, agents, mcps) in one pass, preserving order."""
+    by_kind: dict[str, list] = {"skill": [], "agent": [], "mcp": []}
+    for node in nodes:
+        bucket = by_kind.get(node.kind)
+        if bucket is not None:
+            bucket.append(node)
+    return by_kind["skill"], by_kind["agent"], by_kind["mcp"]
+
+
 def _render_skill_linkcards(nodes: list, *, limit: int | None = None) -> list[str]:
     """Render LinkCard rows for skill hub pages."""
     rows = sorted(nodes, key=lambda item: item.id)
@@ -2013,13 +1053,13 @@ def _render_skill_linkcards(nodes: list, *, limit: int | None = None) -> list[st
         rows = rows[:limit]
     parts: list[str] = []
     for node in rows:
+        title = escape_attr(node.id)
         desc = escape_attr(truncate_sentence(node.description, 160))
         if _skill_id_is_linkable(node.id):
             href = skill_detail_href(node.id, node=node)
-            title = escape_attr(node.id)
             parts.append(f'  <LinkCard title="{title}" href="{href}" description="{desc}" />')
         else:
-            parts.append(f'  <Card title="{escape_attr(node.id)}">{desc}</Card>')
+            parts.append(f'  <Card title="{title}">{desc}</Card>')
     return parts
 
 
@@ -2068,7 +1108,7 @@ def write_catalog_index(nodes: list) -> None:
 
     out_dir = CONTENT_DIR / SKILL_CATALOG_PREFIX
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "index.mdx").write_text("\n".join(parts))
+    _write_text_atomic(out_dir / "index.mdx", "\n".join(parts))
 
 
 def write_catalog_custom_index(nodes: list) -> None:
@@ -2184,7 +1224,7 @@ def write_catalog_custom_index(nodes: list) -> None:
 
     out_dir = CONTENT_DIR / SKILL_CATALOG_PREFIX / "custom"
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "index.mdx").write_text("\n".join(parts))
+    _write_text_atomic(out_dir / "index.mdx", "\n".join(parts))
 
 
 _EXTERNAL_LANE_BY_STATUS = {
@@ -2293,18 +1333,16 @@ def write_catalog_external_index(nodes: list) -> None:
             group = lanes.get(lane_id) or []
             if not group:
                 continue
-            parts.append(f"## {title} ({len(group)})")
-            parts.append("")
+            parts.append(f"## {title} ({len(group)})\n")
             parts.append(f'<div class="catalog-skill" data-skill-lane="{lane_id}">')
             parts.append("<CardGrid>")
             parts.extend(_render_skill_linkcards(group))
             parts.append("</CardGrid>")
-            parts.append("</div>")
-            parts.append("")
+            parts.append("</div>\n")
 
     out_dir = CONTENT_DIR / SKILL_CATALOG_PREFIX / "external"
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "index.mdx").write_text("\n".join(parts))
+    _write_text_atomic(out_dir / "index.mdx", "\n".join(parts))
 
 
 def write_skill_install_scripts_page() -> None:
@@ -2326,41 +1364,48 @@ def write_skill_install_scripts_page() -> None:
 
     out_dir = CONTENT_DIR / "skills"
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "install.mdx").write_text("\n".join(parts))
+    _write_text_atomic(out_dir / "install.mdx", "\n".join(parts))
+
+
+_AGENTS_INDEX_HEADER = """---
+title: Agents
+description: Browse all available AI agent configurations
+---
+
+import { Card, CardGrid, LinkCard, Badge } from '@astrojs/starlight/components';
+
+> Specialized agent configurations with tools, permissions, and system prompts for various AI coding assistants.
+"""
+_MCP_INDEX_HEADER = """---
+title: MCP Servers
+description: Browse all available MCP servers
+---
+
+import { Card, CardGrid, LinkCard, Badge } from '@astrojs/starlight/components';
+
+> Model Context Protocol servers providing tools and data to AI agents.
+"""
 
 
 def write_agents_index(nodes: list) -> None:
     """Write agents/index.mdx category page."""
-    parts = []
-    parts.append("---")
-    parts.append("title: Agents")
-    parts.append("description: Browse all available AI agent configurations")
-    parts.append("---")
-    parts.append("")
-    parts.append("import { Card, CardGrid, LinkCard, Badge } from '@astrojs/starlight/components';")
-    parts.append("")
-    parts.append(
-        "> Specialized agent configurations with tools, permissions,"
-        " and system prompts for various AI coding assistants."
-    )
-    parts.append("")
+    parts = [_AGENTS_INDEX_HEADER]
     parts.append('<div class="stats-bar">')
     parts.append(f'  <span class="stat stat-agent">{len(nodes)} agents available</span>')
-    parts.append("</div>")
-    parts.append("")
-    parts.append("## All Agents")
-    parts.append("")
+    parts.append("</div>\n")
+    parts.append("## All Agents\n")
     parts.append('<div class="catalog-agent">')
     parts.append("<CardGrid>")
-    for n in nodes:
-        desc = escape_attr(truncate_sentence(n.description, 160))
-        parts.append(f'  <LinkCard title="{escape_attr(n.id)}" href="/agents/{n.id}/" description="{desc}" />')
+    parts.extend(
+        f'  <LinkCard title="{escape_attr(n.id)}" href="/agents/{n.id}/" '
+        f'description="{escape_attr(truncate_sentence(n.description, 160))}" />'
+        for n in nodes
+    )
     parts.append("</CardGrid>")
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
     out_dir = CONTENT_DIR / "agents"
     out_dir.mkdir(parents=True, exist_ok=True)
-    (out_dir / "index.mdx").write_text("\n".join(parts))
+    _write_text_atomic(out_dir / "index.mdx", "\n".join(parts))
 
 
 def write_mcp_index(nodes: list) -> None:
@@ -2375,32 +1420,22 @@ def write_mcp_index(nodes: list) -> None:
         if "HAND-MAINTAINED" in existing:
             return
 
-    parts = []
-    parts.append("---")
-    parts.append("title: MCP Servers")
-    parts.append("description: Browse all available MCP servers")
-    parts.append("---")
-    parts.append("")
-    parts.append("import { Card, CardGrid, LinkCard, Badge } from '@astrojs/starlight/components';")
-    parts.append("")
-    parts.append("> Model Context Protocol servers providing tools and data to AI agents.")
-    parts.append("")
+    parts = [_MCP_INDEX_HEADER]
     parts.append('<div class="stats-bar">')
     parts.append(f'  <span class="stat stat-mcp">{len(nodes)} MCP servers available</span>')
-    parts.append("</div>")
-    parts.append("")
-    parts.append("## All MCP Servers")
-    parts.append("")
+    parts.append("</div>\n")
+    parts.append("## All MCP Servers\n")
     parts.append('<div class="catalog-mcp">')
     parts.append("<CardGrid>")
-    for n in nodes:
-        desc = escape_attr(truncate_sentence(n.description, 160))
-        parts.append(f'  <LinkCard title="{escape_attr(n.id)}" href="/mcp/{n.id}/" description="{desc}" />')
+    parts.extend(
+        f'  <LinkCard title="{escape_attr(n.id)}" href="/mcp/{n.id}/" '
+        f'description="{escape_attr(truncate_sentence(n.description, 160))}" />'
+        for n in nodes
+    )
     parts.append("</CardGrid>")
-    parts.append("</div>")
-    parts.append("")
+    parts.append("</div>\n")
 
-    (index_path).write_text("\n".join(parts))
+    _write_text_atomic(index_path, "\n".join(parts))
 
 
 def write_harness_support_page() -> None:
@@ -2458,7 +1493,7 @@ def write_harness_support_page() -> None:
     parts.append("")
     out = CONTENT_DIR / "harness-support.mdx"
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(parts), encoding="utf-8")
+    _write_text_atomic(out, "\n".join(parts))
 
 
 def write_skill_research_pages(nodes: list) -> None:
@@ -2545,7 +1580,7 @@ def write_skill_research_pages(nodes: list) -> None:
             escape_mdx(body),
             "",
         ]
-        (out_dir / f"{skill_id}.mdx").write_text("\n".join(parts), encoding="utf-8")
+        _write_text_atomic(out_dir / f"{skill_id}.mdx", "\n".join(parts))
         written += 1
 
     if written:
@@ -2554,54 +1589,54 @@ def write_skill_research_pages(nodes: list) -> None:
         typer.echo(f"  Skipped {skipped_orphans} orphan research artifacts (no catalog/authoring row)")
 
 
+_SIDEBAR_NAV_LINKS = """// Auto-generated by wagents docs generate — do not edit
+export const navLinks = [
+  { label: 'Overview', link: '/' },
+  { label: 'Start Here', link: '/start-here/' },
+  { label: 'Install', link: '/install/' },
+  { label: 'Surfaces', link: '/surfaces/' },
+  { label: 'Runtimes', link: '/runtimes/' },
+  { label: 'Reference', link: '/reference/' },
+  { label: 'Contributing', link: '/contributing/' }
+];
+
+export default ["""
+_SIDEBAR_SURFACES_HEAD = """  { slug: 'install', label: 'Install' },
+  {
+    label: 'Surfaces',
+    items: [
+      { slug: 'surfaces', label: 'Overview' },
+      { slug: 'surfaces/instructions', label: 'Instructions' },
+      {
+        label: 'Skills',
+        collapsed: true,
+        items: [
+          { slug: 'skills/catalog', label: 'Catalog' },
+          { slug: 'skills/catalog/custom', label: 'Custom skills' },
+          { slug: 'skills/catalog/external', label: 'External skills' },
+          { slug: 'skills/install', label: 'Install scripts' },
+        ],
+      },
+      { slug: 'surfaces/tools', label: 'Tools' },
+      {
+        label: 'Hooks',
+        collapsed: true,
+        items: [{ autogenerate: { directory: 'hooks' } }],
+      },"""
+
+
 def render_sidebar_module(nodes: list) -> str:
     """Render docs/src/generated-sidebar.mjs content without writing to disk."""
-    agents = [n for n in nodes if n.kind == "agent"]
-    mcps = [n for n in nodes if n.kind == "mcp"]
+    has_agents = any(n.kind == "agent" for n in nodes)
+    has_mcps = any(n.kind == "mcp" for n in nodes)
     mcp_overview_path = CONTENT_DIR / "mcp" / "index.mdx"
-    lines = []
-    lines.append("// Auto-generated by wagents docs generate — do not edit")
-    lines.append("export const navLinks = [")
-    nav_items = [
-        "  { label: 'Overview', link: '/' }",
-        "  { label: 'Start Here', link: '/start-here/' }",
-        "  { label: 'Install', link: '/install/' }",
-        "  { label: 'Surfaces', link: '/surfaces/' }",
-        "  { label: 'Runtimes', link: '/runtimes/' }",
-        "  { label: 'Reference', link: '/reference/' }",
-        "  { label: 'Contributing', link: '/contributing/' }",
-    ]
-    lines.append(",\n".join(nav_items))
-    lines.append("];")
-    lines.append("")
-    lines.append("export default [")
+    lines = [_SIDEBAR_NAV_LINKS]
     if (CONTENT_DIR / "index.mdx").exists():
         lines.append("  { label: 'Overview', link: '/' },")
     if (CONTENT_DIR / "start-here.mdx").exists():
         lines.append("  { slug: 'start-here', label: 'Start Here' },")
-    lines.append("  { slug: 'install', label: 'Install' },")
-    lines.append("  {")
-    lines.append("    label: 'Surfaces',")
-    lines.append("    items: [")
-    lines.append("      { slug: 'surfaces', label: 'Overview' },")
-    lines.append("      { slug: 'surfaces/instructions', label: 'Instructions' },")
-    lines.append("      {")
-    lines.append("        label: 'Skills',")
-    lines.append("        collapsed: true,")
-    lines.append("        items: [")
-    lines.append("          { slug: 'skills/catalog', label: 'Catalog' },")
-    lines.append("          { slug: 'skills/catalog/custom', label: 'Custom skills' },")
-    lines.append("          { slug: 'skills/catalog/external', label: 'External skills' },")
-    lines.append("          { slug: 'skills/install', label: 'Install scripts' },")
-    lines.append("        ],")
-    lines.append("      },")
-    lines.append("      { slug: 'surfaces/tools', label: 'Tools' },")
-    lines.append("      {")
-    lines.append("        label: 'Hooks',")
-    lines.append("        collapsed: true,")
-    lines.append("        items: [{ autogenerate: { directory: 'hooks' } }],")
-    lines.append("      },")
-    if agents:
+    lines.append(_SIDEBAR_SURFACES_HEAD)
+    if has_agents:
         lines.append("      {")
         lines.append("        label: 'Agents',")
         lines.append("        collapsed: true,")
@@ -2620,7 +1655,7 @@ def render_sidebar_module(nodes: list) -> str:
     lines.append("      { slug: 'cli', label: 'CLI' },")
     if (CONTENT_DIR / "harness-support.mdx").exists():
         lines.append("      { slug: 'harness-support', label: 'Harness support' },")
-    if mcps:
+    if has_mcps:
         lines.append("      {")
         lines.append("        label: 'MCP',")
         lines.append("        collapsed: true,")
@@ -2666,8 +1701,7 @@ def render_sidebar_module(nodes: list) -> str:
     lines.append("  },")
     if (CONTENT_DIR / "contributing.mdx").exists():
         lines.append("  { slug: 'contributing', label: 'Contributing' },")
-    lines.append("];")
-    lines.append("")
+    lines.append("];\n")
     return "\n".join(lines)
 
 
@@ -2675,10 +1709,7 @@ def write_sidebar(nodes: list) -> None:
     """Write docs/src/generated-sidebar.mjs with dynamic sidebar config."""
     sidebar_path = DOCS_DIR / "src" / "generated-sidebar.mjs"
     sidebar_path.parent.mkdir(parents=True, exist_ok=True)
-    content = render_sidebar_module(nodes)
-    tmp_path = sidebar_path.with_suffix(".mjs.tmp")
-    tmp_path.write_text(content, encoding="utf-8")
-    tmp_path.replace(sidebar_path)
+    _write_text_atomic(sidebar_path, render_sidebar_module(nodes))
 
 
 def regenerate_sidebar_and_indexes(*, include_installed: bool = False) -> None:
@@ -2686,9 +1717,7 @@ def regenerate_sidebar_and_indexes(*, include_installed: bool = False) -> None:
     nodes = collect_all_doc_nodes(include_installed=include_installed, include_drafts=False)
     external_entries = read_external_skill_entries()
 
-    skills = [n for n in nodes if n.kind == "skill"]
-    agents_list = [n for n in nodes if n.kind == "agent"]
-    mcps = [n for n in nodes if n.kind == "mcp"]
+    skills, agents_list, mcps = _partition_nodes(nodes)
 
     write_sidebar(nodes)
     write_catalog_index(skills)
@@ -2773,11 +1802,13 @@ def _is_catalog_detail_mdx(path: Path) -> bool:
     return is_catalog_detail_relpath(rel)
 
 
-def _clean_content_subdir(d: Path) -> bool:
+def _clean_content_subdir(d: Path, *, keep_catalog_details: bool = False) -> bool:
     """Remove generated files from *d*, preserving intentional hand hubs.
 
     Catalog skill/agent/mcp *detail* pages always clean even if marked composed
-    or HAND-MAINTAINED so removed assets do not leave orphan MDX.
+    or HAND-MAINTAINED so removed assets do not leave orphan MDX. With
+    *keep_catalog_details*, detail pages stay in place so generate can skip
+    rewriting unchanged ones; ``_prune_stale_detail_pages`` removes orphans.
     """
     if not d.exists():
         return False
@@ -2785,6 +1816,8 @@ def _clean_content_subdir(d: Path) -> bool:
     cleaned = False
     for item in sorted(d.rglob("*"), key=lambda path: len(path.parts), reverse=True):
         if item.is_file():
+            if keep_catalog_details and _is_catalog_detail_mdx(item):
+                continue
             if _is_hand_maintained_mdx(item) and not _is_catalog_detail_mdx(item):
                 typer.echo(f"  Preserved {item.relative_to(CONTENT_DIR)} (hand-maintained)")
                 continue
@@ -2811,16 +1844,39 @@ def _clean_content_subdir(d: Path) -> bool:
 
 docs_app = typer.Typer(help="Documentation site management")
 
+DOCS_GENERATE_LOCK_NAME = ".wagents-docs-generate.lock"
 DOCS_GENERATE_LOCK_MAX_AGE_S = 2 * 60 * 60
+DOCS_RENDER_MAX_WORKERS = min(8, os.cpu_count() or 1)
+DOCS_BUILD_STAMP_NAME = ".wagents-build-digest"
+DOCS_WATCH_DIRS = ("skills", "agents", "mcp")
+DOCS_WATCH_IGNORED_DIRS = LOCAL_MCP_DIR_NAMES | {".git", ".venv", "__pycache__", "node_modules"}
+DOCS_WATCH_INTERVAL_S = 1.0
+DOCS_BUILD_DIGEST_IGNORED_NAMES = frozenset({
+    ".astro",
+    ".vercel",
+    DOCS_GENERATE_LOCK_NAME,
+    "dist",
+    "node_modules",
+})
+# Astro inlines these environment variables (and reads DEV/NODE_ENV), so they are build inputs.
+DOCS_BUILD_ENV_PREFIXES = ("ASTRO_", "DEV", "DOCS_", "NODE_", "POSTHOG_", "PUBLIC_")
 
 
 def _docs_generate_lock_path() -> Path:
-    return DOCS_DIR / ".wagents-docs-generate.lock"
+    return DOCS_DIR / DOCS_GENERATE_LOCK_NAME
+
+
+class DocsGenerateLockBusyError(RuntimeError):
+    """Raised by ``_docs_generate_lock(exit_when_busy=False)`` while another generate holds the lock."""
 
 
 @contextmanager
-def _docs_generate_lock():
-    """Exclusive lock so only one docs generate mutates generated surfaces at a time."""
+def _docs_generate_lock(*, exit_when_busy: bool = True):
+    """Exclusive lock so only one docs generate mutates generated surfaces at a time.
+
+    A busy lock exits the command unless *exit_when_busy* is False, in which case
+    ``DocsGenerateLockBusyError`` lets long-running callers retry later.
+    """
     path = _docs_generate_lock_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     handle = path.open("a+", encoding="utf-8")
@@ -2839,6 +1895,8 @@ def _docs_generate_lock():
             stale = time.time() - path.stat().st_mtime > DOCS_GENERATE_LOCK_MAX_AGE_S
             if stale:
                 fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            elif not exit_when_busy:
+                raise DocsGenerateLockBusyError(holder) from None
             else:
                 typer.echo(
                     f"Another docs generate is in progress ({holder}). "
@@ -2856,6 +1914,16 @@ def _docs_generate_lock():
         handle.close()
 
 
+@lru_cache(maxsize=1)
+def _pnpm_executable() -> str:
+    """Resolve pnpm on PATH once per process so docs subcommands skip the lookup."""
+    pnpm = shutil.which("pnpm")
+    if pnpm is None:
+        typer.echo("Error: pnpm not found. Install pnpm (https://pnpm.io/installation) first.", err=True)
+        raise typer.Exit(code=1)
+    return pnpm
+
+
 @docs_app.command("init")
 def docs_init():
     """One-time setup: install docs dependencies."""
@@ -2863,7 +1931,7 @@ def docs_init():
         typer.echo("Error: docs/package.json not found. Is the scaffold committed?", err=True)
         raise typer.Exit(code=1)
     typer.echo("Installing docs dependencies...")
-    result = subprocess.run(["pnpm", "install"], cwd=str(DOCS_DIR))
+    result = subprocess.run([_pnpm_executable(), "install"], cwd=str(DOCS_DIR))
     if result.returncode != 0:
         typer.echo("Error: pnpm install failed", err=True)
         raise typer.Exit(code=1)
@@ -2978,6 +2046,45 @@ def _resolve_docs_snapshot_date(value: str | None) -> str:
     return validate_docs_graph_snapshot_date(value or _current_utc_snapshot_date())
 
 
+def _render_detail_pages(page_jobs: list[tuple[CatalogNode, Path, str]], edges: list, nodes: list) -> list[str]:
+    """Render and write detail pages on a thread pool; return relpaths in input order.
+
+    Pages are independent, so file reads (raw SKILL.md, research cache) and
+    writes overlap across workers instead of running one page at a time.
+    """
+
+    edges_by_target = group_edges_by_target(edges)
+    nodes_by_key = index_nodes_by_key(nodes)
+
+    def render_one(job: tuple[CatalogNode, Path, str]) -> str:
+        node, out_file, rel = job
+        content = render_page(node, edges, nodes, edges_by_target=edges_by_target, nodes_by_key=nodes_by_key)
+        # Leave unchanged pages untouched so the Astro dev server only reloads real edits.
+        if not out_file.is_file() or out_file.read_text(encoding="utf-8") != content:
+            _write_text_atomic(out_file, content)
+        return rel
+
+    if len(page_jobs) <= 1:
+        return [render_one(job) for job in page_jobs]
+    workers = min(len(page_jobs), DOCS_RENDER_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_one, page_jobs))
+
+
+def _prune_stale_detail_pages(written: set[Path]) -> None:
+    """Remove catalog detail pages this generate run did not write, then empty dirs."""
+    for subdir in ("skills", "agents", "mcp"):
+        root = CONTENT_DIR / subdir
+        if not root.exists():
+            continue
+        for item in sorted(root.rglob("*"), key=lambda path: len(path.parts), reverse=True):
+            if item.is_file():
+                if _is_catalog_detail_mdx(item) and item not in written:
+                    item.unlink(missing_ok=True)
+            elif item.is_dir() and not any(item.iterdir()):
+                item.rmdir()
+
+
 def _docs_generate_impl(
     *,
     include_drafts: bool,
@@ -2996,7 +2103,7 @@ def _docs_generate_impl(
     typer.echo("  Synced custom authoring MDX + wrote skills-catalog-index.json and skills-catalog-browser-index.json")
 
     for subdir in ["skills", "agents", "mcp", "surfaces"]:
-        _clean_content_subdir(CONTENT_DIR / subdir)
+        _clean_content_subdir(CONTENT_DIR / subdir, keep_catalog_details=True)
     for f in ["index.mdx", "install.mdx", "runtimes.mdx", "reference.mdx", "cli.mdx", "harness-support.mdx"]:
         p = CONTENT_DIR / f
         if p.exists() and not _is_hand_maintained_mdx(p):
@@ -3015,30 +2122,35 @@ def _docs_generate_impl(
     catalog_dir = CONTENT_DIR / SKILL_CATALOG_PREFIX
     catalog_dir.mkdir(parents=True, exist_ok=True)
 
+    page_jobs: list[tuple[CatalogNode, Path, str]] = []
+    page_dirs: set[Path] = set()
     for node in nodes:
         if node.kind == "skill":
             group = skill_catalog_group(node=node)
             page_dir = catalog_dir / group
-            page_dir.mkdir(parents=True, exist_ok=True)
-            out_file = page_dir / f"{node.id}.mdx"
             rel = f"{SKILL_CATALOG_PREFIX}/{group}/{node.id}.mdx"
         else:
             kind_dir = f"{node.kind}s" if node.kind != "mcp" else "mcp"
             page_dir = CONTENT_DIR / kind_dir
-            page_dir.mkdir(parents=True, exist_ok=True)
-            out_file = page_dir / f"{node.id}.mdx"
             rel = f"{kind_dir}/{node.id}.mdx"
+        if page_dir not in page_dirs:
+            page_dir.mkdir(parents=True, exist_ok=True)
+            page_dirs.add(page_dir)
+        out_file = page_dir / f"{node.id}.mdx"
         # Catalog surfaces (skills/agents/mcp detail pages) always regenerate from SSOT.
         # HAND-MAINTAINED only freezes non-catalog hand hubs (start-here, hooks hub, etc.).
         if out_file.exists() and _is_hand_maintained_mdx(out_file) and node.kind not in {"skill", "agent", "mcp"}:
             typer.echo(f"  Preserved {rel} (hand-maintained)")
             continue
-        out_file.write_text(render_page(node, edges, nodes))
-        typer.echo(f"  Generated {rel}")
+        page_jobs.append((node, out_file, rel))
 
-    skills = [n for n in nodes if n.kind == "skill"]
-    agents = [n for n in nodes if n.kind == "agent"]
-    mcps = [n for n in nodes if n.kind == "mcp"]
+    rendered = _render_detail_pages(page_jobs, edges, nodes)
+    if rendered:
+        # One write for the whole batch rather than a flush per page.
+        typer.echo("\n".join(f"  Generated {rel}" for rel in rendered))
+    _prune_stale_detail_pages({out_file for _node, out_file, _rel in page_jobs})
+
+    skills, agents, mcps = _partition_nodes(nodes)
 
     write_catalog_index(skills)
     typer.echo("  Generated skills/catalog/index.mdx")
@@ -3130,17 +2242,92 @@ def docs_generate(
         )
 
 
+def _docs_watch_fingerprint() -> tuple[tuple[str, int, int], ...]:
+    """Stat-only snapshot of the asset trees that docs pages are generated from."""
+    entries: list[tuple[str, int, int]] = []
+    for name in DOCS_WATCH_DIRS:
+        for dirpath, dirnames, filenames in os.walk(ROOT / name):
+            dirnames[:] = [d for d in dirnames if d not in DOCS_WATCH_IGNORED_DIRS]
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _watch_and_regenerate(server: subprocess.Popen, *, snapshot_date: str) -> None:
+    """Poll asset trees while *server* runs and regenerate docs after each settled change.
+
+    Detail pages whose content is unchanged are not rewritten, so the dev
+    server only reloads pages an edit actually touched. A failed regeneration
+    is reported and watching continues; a busy generate lock is retried on
+    the next poll.
+    """
+    fingerprint = _docs_watch_fingerprint()
+    while server.poll() is None:
+        time.sleep(DOCS_WATCH_INTERVAL_S)
+        current = _docs_watch_fingerprint()
+        if current == fingerprint:
+            continue
+        # Debounce: wait for editors and git checkouts to finish writing.
+        while True:
+            time.sleep(DOCS_WATCH_INTERVAL_S)
+            settled = _docs_watch_fingerprint()
+            if settled == current:
+                break
+            current = settled
+        typer.echo("Change detected; regenerating docs...")
+        try:
+            with _docs_generate_lock(exit_when_busy=False):
+                _docs_generate_impl(include_drafts=False, include_installed=False, snapshot_date=snapshot_date)
+        except DocsGenerateLockBusyError as exc:
+            # Leave the fingerprint stale so the next poll retries.
+            typer.echo(f"Another docs generate is in progress ({exc}); retrying on the next poll.", err=True)
+            continue
+        except typer.Exit as exc:
+            typer.echo(f"Docs regeneration failed (exit code {exc.exit_code}); still watching.", err=True)
+        except Exception as exc:
+            typer.echo(f"Docs regeneration failed: {exc}; still watching.", err=True)
+        # Generation only writes under docs/, so keep the pre-generate snapshot: an
+        # asset edit saved while generating still differs from it on the next poll.
+        fingerprint = current
+
+
 @docs_app.command("dev")
-def docs_dev():
+def docs_dev(
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help=(
+            "Regenerate pages when skills/, agents/, or mcp/ change. Polling watcher: re-stats those trees "
+            "every second."
+        ),
+    ),
+):
     """Generate content and start dev server."""
+    watch = _resolve_typer_option(watch, default=False)
+    snapshot_date = _resolve_docs_snapshot_date(None)
     with _docs_generate_lock():
         _docs_generate_impl(
             include_drafts=False,
             include_installed=False,
-            snapshot_date=_resolve_docs_snapshot_date(None),
+            snapshot_date=snapshot_date,
         )
     typer.echo("Starting dev server...")
-    subprocess.run(["pnpm", "dev"], cwd=str(DOCS_DIR))
+    if not watch:
+        subprocess.run([_pnpm_executable(), "dev"], cwd=str(DOCS_DIR))
+        return
+    server = subprocess.Popen([_pnpm_executable(), "dev"], cwd=str(DOCS_DIR))
+    try:
+        _watch_and_regenerate(server, snapshot_date=snapshot_date)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.terminate()
+        server.wait()
 
 
 def _clean_docs_build_outputs() -> None:
@@ -3148,41 +2335,109 @@ def _clean_docs_build_outputs() -> None:
         shutil.rmtree(DOCS_DIR / relative, ignore_errors=True)
 
 
+def _docs_build_stamp_path() -> Path:
+    # Outside dist/ so the digest is never deployed with the site.
+    return DOCS_DIR / ".astro" / DOCS_BUILD_STAMP_NAME
+
+
+def _docs_toolchain_versions() -> list[str]:
+    """Return ``node --version`` and ``pnpm --version`` output for the build digest.
+
+    Only node can be reported missing; without pnpm there is nothing to build, so
+    ``_pnpm_executable`` exits instead.
+    """
+
+    def version(executable: str) -> str:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True, check=False)
+        return result.stdout.strip()
+
+    node = shutil.which("node")
+    return [
+        f"node: {version(node)}" if node is not None else "node: missing",
+        f"pnpm: {version(_pnpm_executable())}",
+    ]
+
+
+def _docs_build_digest() -> str:
+    """Hash everything a ``pnpm build`` depends on: docs/ files, build env, and toolchain versions.
+
+    docs/ is hashed except dependencies, build outputs, and the generate lock, so
+    regenerated-but-identical MDX does not count as a change.
+    """
+    inputs = [path for path in DOCS_DIR.iterdir() if path.name not in DOCS_BUILD_DIGEST_IGNORED_NAMES]
+    digest = hashlib.sha256(filesystem_digest(inputs, ignored_dirs=DOCS_BUILD_DIGEST_IGNORED_NAMES).encode("utf-8"))
+    for name in sorted(os.environ):
+        if name.startswith(DOCS_BUILD_ENV_PREFIXES):
+            digest.update(f"\0env:{name}={os.environ[name]}".encode())
+    for version in _docs_toolchain_versions():
+        digest.update(f"\0tool:{version}".encode())
+    return digest.hexdigest()
+
+
+def _build_docs_site(*, incremental: bool) -> bool:
+    """Run ``pnpm build``; with *incremental*, skip it when the build digest matches the last build.
+
+    Returns True when a build ran.
+    """
+    digest = _docs_build_digest() if incremental else None
+    stamp_path = _docs_build_stamp_path()
+    if (
+        digest is not None
+        and (DOCS_DIR / "dist").is_dir()
+        and stamp_path.is_file()
+        and stamp_path.read_text(encoding="utf-8").strip() == digest
+    ):
+        typer.echo("Build inputs unchanged; reusing docs/dist/")
+        return False
+    typer.echo("Building...")
+    _clean_docs_build_outputs()
+    result = subprocess.run([_pnpm_executable(), "build"], cwd=str(DOCS_DIR))
+    if result.returncode != 0:
+        typer.echo("Error: build failed", err=True)
+        raise typer.Exit(code=1)
+    if digest is not None:
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(digest + "\n", encoding="utf-8")
+    return True
+
+
+_INCREMENTAL_HELP = (
+    "Skip pnpm build when docs/ files, build environment variables, and node/pnpm versions match the last "
+    "--incremental build"
+)
+
+
 @docs_app.command("build")
-def docs_build():
+def docs_build(
+    incremental: bool = typer.Option(False, "--incremental", help=_INCREMENTAL_HELP),
+):
     """Generate content and build static site."""
+    incremental = _resolve_typer_option(incremental, default=False)
     with _docs_generate_lock():
         _docs_generate_impl(
             include_drafts=False,
             include_installed=False,
             snapshot_date=_resolve_docs_snapshot_date(None),
         )
-    typer.echo("Building...")
-    _clean_docs_build_outputs()
-    result = subprocess.run(["pnpm", "build"], cwd=str(DOCS_DIR))
-    if result.returncode != 0:
-        typer.echo("Error: build failed", err=True)
-        raise typer.Exit(code=1)
-    typer.echo("Build complete. Output in docs/dist/")
+    if _build_docs_site(incremental=incremental):
+        typer.echo("Build complete. Output in docs/dist/")
 
 
 @docs_app.command("preview")
-def docs_preview():
+def docs_preview(
+    incremental: bool = typer.Option(False, "--incremental", help=_INCREMENTAL_HELP),
+):
     """Generate, build, and preview the site."""
+    incremental = _resolve_typer_option(incremental, default=False)
     with _docs_generate_lock():
         _docs_generate_impl(
             include_drafts=False,
             include_installed=False,
             snapshot_date=_resolve_docs_snapshot_date(None),
         )
-    typer.echo("Building...")
-    _clean_docs_build_outputs()
-    result = subprocess.run(["pnpm", "build"], cwd=str(DOCS_DIR))
-    if result.returncode != 0:
-        typer.echo("Error: build failed", err=True)
-        raise typer.Exit(code=1)
+    _build_docs_site(incremental=incremental)
     typer.echo("Starting preview server...")
-    subprocess.run(["pnpm", "preview"], cwd=str(DOCS_DIR))
+    subprocess.run([_pnpm_executable(), "preview"], cwd=str(DOCS_DIR))
 
 
 def _research_coverage_types(resolved_source_type: ResearchSourceType, *, include_installed: bool) -> list[str]:
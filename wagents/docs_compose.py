@@ -12,6 +12,7 @@ import yaml
 
 from wagents import CONTENT_DIR, ROOT
 from wagents.docs_lint import HAND_MAINTAINED_SENTINEL
+from wagents.parsing import load_yaml
 from wagents.skill_docs import collect_all_doc_nodes
 
 if TYPE_CHECKING:
@@ -49,7 +50,7 @@ def _parse_frontmatter(text: str) -> dict:
         return {}
     block = text[3:end].strip()
     try:
-        data = yaml.safe_load(block)
+        data = load_yaml(block)
     except yaml.YAMLError:
         return {}
     return data if isinstance(data, dict) else {}
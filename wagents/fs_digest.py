@@ -0,0 +1,67 @@
+"""Deterministic content digests of live filesystem trees."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+FILESYSTEM_DIGEST_ALGORITHM = "lstat-tree-v1"
+
+
+def _digest_field(digest: Any, label: str, value: str | bytes) -> None:
+    digest.update(label.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(value if isinstance(value, bytes) else value.encode("utf-8"))
+    digest.update(b"\0")
+
+
+def _entry_digest(digest: Any, path: Path, relative: str, ignored_dirs: frozenset[str]) -> None:
+    try:
+        metadata = path.lstat()
+    except FileNotFoundError:
+        _digest_field(digest, "missing", relative)
+        return
+
+    mode = metadata.st_mode
+    _digest_field(digest, "entry", relative)
+    _digest_field(digest, "mode", format(stat.S_IMODE(mode), "04o"))
+    if stat.S_ISLNK(mode):
+        _digest_field(digest, "type", "symlink")
+        _digest_field(digest, "target", os.readlink(path))
+        return
+    if stat.S_ISREG(mode):
+        _digest_field(digest, "type", "file")
+        _digest_field(digest, "content", path.read_bytes())
+        return
+    if stat.S_ISDIR(mode):
+        _digest_field(digest, "type", "directory")
+        for child in sorted(path.iterdir(), key=lambda item: item.name):
+            if child.name in ignored_dirs:
+                try:
+                    child_mode = child.lstat().st_mode
+                except FileNotFoundError:
+                    child_mode = 0
+                if stat.S_ISDIR(child_mode):
+                    continue
+            child_relative = child.name if relative == "." else f"{relative}/{child.name}"
+            _entry_digest(digest, child, child_relative, ignored_dirs)
+        return
+    _digest_field(digest, "type", f"special:{stat.S_IFMT(mode):o}")
+
+
+def filesystem_digest(paths: Iterable[str | Path], *, ignored_dirs: Iterable[str] = ()) -> str:
+    """Hash live filesystem state without following symlinks."""
+
+    digest = hashlib.sha256()
+    ignored = frozenset(str(value) for value in ignored_dirs)
+    normalized = sorted({Path(value).expanduser().absolute() for value in paths}, key=str)
+    for root in normalized:
+        _digest_field(digest, "root", str(root))
+        _entry_digest(digest, root, ".", ignored)
+    return digest.hexdigest()
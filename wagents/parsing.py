@@ -1,8 +1,11 @@
 """Frontmatter parsing, fence tracking, and text transforms."""
 
+import copy
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, cast
 
 import yaml
@@ -13,6 +16,7 @@ def to_title(name: str) -> str:
     return name.replace("-", " ").title()
 
 
+@lru_cache(maxsize=4096)
 def truncate_sentence(text: str, max_len: int) -> str:
     """Truncate at sentence boundary before max_len; fall back to word boundary with ellipsis.
 
@@ -22,12 +26,9 @@ def truncate_sentence(text: str, max_len: int) -> str:
     if len(text) <= max_len:
         return text
     chunk = text[:max_len]
-    # Find last sentence boundary
-    result: str | None = None
-    for i in range(len(chunk) - 1, -1, -1):
-        if chunk[i] in ".!?":
-            result = chunk[: i + 1]
-            break
+    # Find last sentence boundary (C-level rfind on the bounded slice)
+    boundary = max(chunk.rfind("."), chunk.rfind("!"), chunk.rfind("?"))
+    result: str | None = chunk[: boundary + 1] if boundary != -1 else None
     # Fall back to word boundary
     if result is None:
         last_space = chunk.rfind(" ")
@@ -60,11 +61,16 @@ def _neutralize_catalog_link(match: re.Match[str]) -> str:
     return match.group(0)
 
 
+def sanitize_catalog_link_line(line: str) -> str:
+    """Neutralize unresolvable catalog links in a single line (no fence tracking)."""
+    return _LINK_PATTERN.sub(_neutralize_catalog_link, line)
+
+
 def sanitize_catalog_links(text: str, *, fence_aware: bool = False) -> str:
     """Neutralize links that cannot resolve on generated docs catalog pages."""
     if not fence_aware:
-        return _LINK_PATTERN.sub(_neutralize_catalog_link, text)
-    return process_outside_fences(text, lambda line: _LINK_PATTERN.sub(_neutralize_catalog_link, line))
+        return sanitize_catalog_link_line(text)
+    return process_outside_fences(text, sanitize_catalog_link_line)
 
 
 def strip_relative_md_links(text: str) -> str:
@@ -131,28 +137,68 @@ def shift_headings(body: str, levels: int = 1) -> str:
     return process_outside_fences(body, lambda line: re.sub(r"^(#{1,5})", lambda m: extra + m.group(1), line))
 
 
+@lru_cache(maxsize=4096)
 def escape_attr(text: str) -> str:
     """Escape text for use in HTML/MDX attribute values."""
     return text.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+# libyaml's loader builds the same objects as yaml.safe_load several times faster;
+# fall back to the pure-Python loader when PyYAML was built without it.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(text: str) -> Any:
+    """Load *text* like ``yaml.safe_load``, using libyaml when it is available."""
+    return yaml.load(text, Loader=_YAML_SAFE_LOADER)
+
+
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter and return (frontmatter_dict, body)."""
     if not content.startswith("---\n"):
         raise ValueError("Invalid frontmatter: must start with '---'")
-    rest = content[4:]
-    end_idx = rest.find("\n---\n")
+    # Search the original string from offset 4 rather than slicing off the opening fence.
+    end_idx = content.find("\n---\n", 4)
     if end_idx == -1:
         # Handle case where --- is at very end of file
-        if rest.endswith("\n---"):
-            end_idx = len(rest) - 3
+        if content.endswith("\n---", 4):
+            end_idx = len(content) - 3
         else:
             raise ValueError("Invalid frontmatter: missing closing '---'")
-    frontmatter = yaml.safe_load(rest[:end_idx])
-    body = rest[end_idx + 5 :].strip()
+    frontmatter = load_yaml(content[4:end_idx])
+    body = content[end_idx + 5 :].strip()
     return frontmatter, body
 
 
+# One entry per path, tagged with the (mtime_ns, size) it was parsed at, so repeated
+# edits (docs dev --watch) replace the entry instead of piling up old versions.
+_FRONTMATTER_CACHE: dict[str, tuple[int, int, tuple[dict, str]]] = {}
+
+
+def _parse_frontmatter_file(path: Path) -> tuple[dict, str]:
+    # Whole-file bytes decode skips the text-mode reader; translate newlines as it would.
+    content = path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return parse_frontmatter(content)
+
+
+def read_frontmatter(path: Path) -> tuple[dict, str]:
+    """Read and parse *path*, reusing the parse while the file is unchanged.
+
+    The frontmatter dict is a fresh copy on every call, so callers may mutate it.
+    """
+    stat = path.stat()
+    key = str(path)
+    cached = _FRONTMATTER_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        frontmatter, body = cached[2]
+    else:
+        frontmatter, body = _parse_frontmatter_file(path)
+        _FRONTMATTER_CACHE[key] = (stat.st_mtime_ns, stat.st_size, (frontmatter, body))
+    return copy.deepcopy(frontmatter), body
+
+
 # ---------------------------------------------------------------------------
 # Hook extraction
 # ---------------------------------------------------------------------------
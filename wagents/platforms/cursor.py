@@ -12,7 +12,7 @@ from wagents.context import get_repo_root
 from wagents.hooks.merge import merge_cursor_flat_hooks
 from wagents.hooks.registry import sync_hook_projection
 from wagents.hooks.render import render_cursor_global_hooks, render_cursor_hooks, resolve_hook_perf_tier
-from wagents.parsing import parse_frontmatter
+from wagents.parsing import read_frontmatter
 from wagents.platforms.base import (
     HOME,
     PlatformAdapter,
@@ -262,7 +262,7 @@ def _portable_agent_files() -> list[Path]:
 
 
 def _render_cursor_agent(path: Path, overlay: dict[str, Any]) -> str:
-    frontmatter, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+    frontmatter, body = read_frontmatter(path)
     name = str(frontmatter.get("name") or path.stem)
     data: dict[str, Any] = {
         "name": name,
@@ -278,7 +278,7 @@ def _render_cursor_agent(path: Path, overlay: dict[str, Any]) -> str:
 def _render_cursor_agents() -> dict[str, str]:
     overlays = _load_cursor_agent_overlays()
     agent_files = _portable_agent_files()
-    names = {parse_frontmatter(path.read_text(encoding="utf-8"))[0].get("name", path.stem) for path in agent_files}
+    names = {read_frontmatter(path)[0].get("name", path.stem) for path in agent_files}
     overlay_names = set(overlays)
     missing = sorted(str(name) for name in names - overlay_names)
     extra = sorted(overlay_names - {str(name) for name in names})
@@ -292,7 +292,7 @@ def _render_cursor_agents() -> dict[str, str]:
 
     rendered: dict[str, str] = {}
     for path in agent_files:
-        frontmatter, _ = parse_frontmatter(path.read_text(encoding="utf-8"))
+        frontmatter, _ = read_frontmatter(path)
         name = str(frontmatter.get("name") or path.stem)
         rendered[f"{name}.md"] = _render_cursor_agent(path, overlays[name])
     return rendered
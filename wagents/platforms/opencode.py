@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from wagents.parsing import parse_frontmatter
+from wagents.parsing import parse_frontmatter, read_frontmatter
 from wagents.platforms.base import (
     HOME,
     REPO_ROOT,
@@ -716,7 +716,7 @@ def _load_opencode_agent_overlays(path: Path | None = None) -> dict[str, dict[st
 
 
 def _render_opencode_agent(path: Path, overlay: dict[str, Any]) -> str:
-    frontmatter, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+    frontmatter, body = read_frontmatter(path)
     name = str(frontmatter.get("name") or path.stem)
     data: dict[str, Any] = {
         "name": name,
@@ -736,9 +736,7 @@ def _render_opencode_agent(path: Path, overlay: dict[str, Any]) -> str:
 def _render_opencode_agents() -> dict[str, str]:
     overlays = _load_opencode_agent_overlays()
     agent_files = _portable_agent_files()
-    names = {
-        str(parse_frontmatter(path.read_text(encoding="utf-8"))[0].get("name") or path.stem) for path in agent_files
-    }
+    names = {str(read_frontmatter(path)[0].get("name") or path.stem) for path in agent_files}
     overlay_names = set(overlays)
     missing = sorted(names - overlay_names)
     extra = sorted(overlay_names - names)
@@ -754,7 +752,7 @@ def _render_opencode_agents() -> dict[str, str]:
 
     rendered: dict[str, str] = {}
     for path in agent_files:
-        frontmatter, _ = parse_frontmatter(path.read_text(encoding="utf-8"))
+        frontmatter, _ = read_frontmatter(path)
         name = str(frontmatter.get("name") or path.stem)
         rendered[f"{name}.md"] = _render_opencode_agent(path, overlays[name])
     return rendered
@@ -8,7 +8,7 @@ import typer
 import yaml
 
 from wagents import CONTENT_DIR, GITHUB_BASE, ROOT
-from wagents.catalog import RELATED_SKILLS, CatalogEdge, CatalogNode
+from wagents.catalog import RELATED_SKILLS, CatalogEdge, CatalogNode, group_edges_by_target, index_nodes_by_key
 from wagents.page_chrome import provenance_one_liner, render_metadata_details
 from wagents.page_density import (
     DEFAULT_SKILL_DENSITY,
@@ -30,7 +30,7 @@ from wagents.parsing import (
     escape_attr,
     is_navigable_catalog_link_target,
     process_outside_fences,
-    sanitize_catalog_links,
+    sanitize_catalog_link_line,
     shift_headings,
     truncate_sentence,
 )
@@ -53,6 +53,12 @@ from wagents.skill_research import load_skill_research
 # ---------------------------------------------------------------------------
 
 
+# Characters escape_mdx_line may rewrite; lines without any pass through untouched.
+_MDX_ESCAPE_TRIGGER_RE = re.compile(r"[{}<>`]")
+# Characters escaped outside inline code spans.
+_MDX_SPECIAL_CHAR_RE = re.compile(r"[{}<>]")
+
+
 def escape_mdx(body: str) -> str:
     """Escape markdown body for safe MDX embedding."""
     return process_outside_fences(body, escape_mdx_line)
@@ -60,66 +66,66 @@ def escape_mdx(body: str) -> str:
 
 def escape_mdx_line(line: str) -> str:
     """Escape a single MDX line, preserving inline code spans."""
-    if line.startswith("import ") or line.startswith("export "):
+    if line.startswith(("import ", "export ")):
         return "\\" + line
+    if not _MDX_ESCAPE_TRIGGER_RE.search(line):
+        return line
 
     # Normalize markdown-escaped angle brackets from upstream SKILL sources.
     line = re.sub(r"\\([<>])", r"\1", line)
+    n = len(line)
 
-    # Find all inline code span ranges
+    # Find all inline code span ranges (sorted, non-overlapping)
     code_ranges = []
-    i = 0
-    while i < len(line):
-        if line[i] == "`":
-            bt_start = i
-            bt_count = 0
-            while i < len(line) and line[i] == "`":
-                bt_count += 1
-                i += 1
-            close_idx = line.find("`" * bt_count, i)
-            if close_idx != -1:
-                code_ranges.append((bt_start, close_idx + bt_count))
-                i = close_idx + bt_count
+    i = line.find("`")
+    while i != -1:
+        run_end = i + 1
+        while run_end < n and line[run_end] == "`":
+            run_end += 1
+        close_idx = line.find(line[i:run_end], run_end)
+        if close_idx == -1:
+            i = line.find("`", run_end)
         else:
-            i += 1
-
-    def in_code(pos):
-        return any(s <= pos < e for s, e in code_ranges)
+            span_end = close_idx + run_end - i
+            code_ranges.append((i, span_end))
+            i = line.find("`", span_end)
 
     out = []
+    span = 0  # first code range that ends after i; i only moves forward
     i = 0
-    while i < len(line):
-        if in_code(i):
-            if line[i] == "|":
-                out.append("\\|")
-            elif line[i] == "<":
-                out.append("&lt;")
-            elif line[i] == ">":
-                out.append("&gt;")
-            else:
-                out.append(line[i])
-            i += 1
+    while i < n:
+        while span < len(code_ranges) and code_ranges[span][1] <= i:
+            span += 1
+        span_start = n
+        if span < len(code_ranges):
+            span_start, span_end = code_ranges[span]
+            if span_start <= i:
+                out.append(line[i:span_end].replace("|", "\\|").replace("<", "&lt;").replace(">", "&gt;"))
+                i = span_end
+                continue
+        # Copy the plain run up to the next special character (or code span) in one slice.
+        match = _MDX_SPECIAL_CHAR_RE.search(line, i, span_start)
+        if match is None:
+            out.append(line[i:span_start])
+            i = span_start
             continue
-        if line[i : i + 4] == "<!--":
+        if match.start() > i:
+            out.append(line[i : match.start()])
+            i = match.start()
+        ch = line[i]
+        if ch == "<" and line.startswith("<!--", i):
             end = line.find("-->", i + 4)
             if end != -1:
                 content = line[i + 4 : end].strip()
                 out.append("{/* " + content + " */}")
                 i = end + 3
                 continue
-        if line[i] in "{}":
-            out.append("\\" + line[i])
-            i += 1
-            continue
-        if line[i] == "<":
+        if ch == "<":
             out.append("&lt;")
-            i += 1
-            continue
-        if line[i] == ">":
+        elif ch == ">":
             out.append("&gt;")
-            i += 1
-            continue
-        out.append(line[i])
+        else:
+            out.append("\\" + ch)
         i += 1
 
     return "".join(out)
@@ -130,6 +136,52 @@ def escape_mdx_line(line: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+# (label, key, code) specs for metadata tab rows; truthy values only, in order.
+_SKILL_GENERAL_FIELDS = (("Name", "name", True), ("License", "license", False))
+_SKILL_META_FIELDS = (("Version", "version", False), ("Author", "author", False))
+_SKILL_CLAUDE_CODE_FIELDS = (("Model", "model", True), ("Context", "context", True), ("Agent", "agent", True))
+_SKILL_COMPAT_FIELDS = (("Compatibility", "compatibility", False), ("Allowed Tools", "allowed-tools", True))
+_AGENT_IDENTITY_FIELDS = (
+    ("Model", "model", True),
+    ("Permission Mode", "permissionMode", True),
+    ("Max Turns", "maxTurns", False),
+    ("Memory", "memory", True),
+)
+_AGENT_TOOLS_FIELDS = (("Allowed", "tools", True), ("Disallowed", "disallowedTools", True))
+_MCP_PACKAGE_FIELDS = (("Name", "name", True), ("Version", "version", False), ("Python", "requires-python", True))
+
+
+def _field_table(rows: list[str]) -> str:
+    """Render *rows* under the two-column Field/Value table header in one join."""
+    return "\n".join(["| Field | Value |", "| ----- | ----- |", *rows])
+
+
+def _field_rows(source: dict, specs: tuple[tuple[str, str, bool], ...]) -> list[str]:
+    """Render ``| Label | value |`` table rows for the truthy *specs* keys in *source*."""
+    return [
+        f"| {label} | `{value}` |" if code else f"| {label} | {value} |"
+        for label, key, code in specs
+        if (value := source.get(key))
+    ]
+
+
+# Generated-page banner + Starlight imports that follow the closing frontmatter
+# fence; constant per page kind, so each is fused into a single parts entry.
+_GENERATED_BANNER = "{/* GENERATED by wagents docs generate — do not edit */}"
+_SKILL_PAGE_PREAMBLE = (
+    f"\n{_GENERATED_BANNER}\n\n"
+    "import { Badge, Tabs, TabItem, Card, CardGrid, LinkCard, Aside, Steps } from '@astrojs/starlight/components';\n"
+)
+_AGENT_PAGE_PREAMBLE = (
+    f"\n{_GENERATED_BANNER}\n\n"
+    "import { Badge, Tabs, TabItem, Card, CardGrid, LinkCard, Aside } from '@astrojs/starlight/components';\n"
+)
+_MCP_PAGE_PREAMBLE = (
+    f"\n{_GENERATED_BANNER}\n\n"
+    "import { Badge, Tabs, TabItem, Aside, Code, CardGrid, LinkCard } from '@astrojs/starlight/components';\n"
+)
+
+
 def render_tabs(tab_items: list[tuple[str, str]], *, density: PageDensity = "standard") -> list[str]:
     """Render a list of (label, content) pairs as MDX Tabs or a single heading."""
     parts: list[str] = []
@@ -156,14 +208,26 @@ def render_tabs(tab_items: list[tuple[str, str]], *, density: PageDensity = "sta
     return parts
 
 
-def render_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: list[CatalogNode]) -> str:
-    """Render a CatalogNode to MDX string."""
+def render_page(
+    node: CatalogNode,
+    edges: list[CatalogEdge],
+    all_nodes: list[CatalogNode],
+    *,
+    edges_by_target: dict[str, list[CatalogEdge]] | None = None,
+    nodes_by_key: dict[tuple[str, str], CatalogNode] | None = None,
+) -> str:
+    """Render a CatalogNode to MDX string.
+
+    Batch callers pass *edges_by_target* (see ``group_edges_by_target``) and
+    *nodes_by_key* (see ``index_nodes_by_key``) so edges are grouped and nodes
+    indexed once per build instead of scanned once per page.
+    """
     if node.kind == "skill":
-        return render_skill_page(node, edges, all_nodes)
+        return render_skill_page(node, edges, all_nodes, edges_by_target=edges_by_target, nodes_by_key=nodes_by_key)
     if node.kind == "agent":
-        return render_agent_page(node, edges, all_nodes)
+        return render_agent_page(node, edges, all_nodes, nodes_by_key=nodes_by_key)
     if node.kind == "mcp":
-        return render_mcp_page(node, edges, all_nodes)
+        return render_mcp_page(node, edges, all_nodes, edges_by_target=edges_by_target, nodes_by_key=nodes_by_key)
     return ""
 
 
@@ -185,14 +249,15 @@ def scaffold_doc_page(node: CatalogNode) -> None:
     typer.echo(f"Created {rel}")
 
 
+_FENCE_RUN_RE = re.compile(r"^[^\S\n]*(`{3,}|~{3,})", re.MULTILINE)
+
+
 def safe_outer_fence(content: str) -> str:
     """Return a backtick fence longer than any fence inside *content*."""
-    max_fence = 3
-    for line in content.split("\n"):
-        stripped = line.lstrip()
-        if stripped.startswith("```") or stripped.startswith("~~~"):
-            fence_len = len(stripped) - len(stripped.lstrip(stripped[0]))
-            max_fence = max(max_fence, fence_len)
+    if "````" not in content and "~~~~" not in content:
+        # No run can exceed the default, so skip the line scan.
+        return "````"
+    max_fence = max((len(run) for run in _FENCE_RUN_RE.findall(content)), default=3)
     return "`" * (max_fence + 1)
 
 
@@ -204,11 +269,28 @@ def _resolve_raw_path(node: CatalogNode) -> Path:
     return raw
 
 
+# One entry per path, tagged with the (mtime_ns, size) it was read at, so repeated
+# edits replace the entry instead of piling up old versions.
+_RAW_TEXT_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def _read_raw_text(path: Path) -> str:
+    """Read *path*, reusing the previous read while its mtime and size are unchanged."""
+    stat = path.stat()
+    key = str(path)
+    cached = _RAW_TEXT_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    text = path.read_text()
+    _RAW_TEXT_CACHE[key] = (stat.st_mtime_ns, stat.st_size, text)
+    return text
+
+
 def read_raw_content(node: CatalogNode) -> str:
     """Read the raw file content for a CatalogNode from disk."""
     raw_path = _resolve_raw_path(node)
     try:
-        return raw_path.read_text()
+        return _read_raw_text(raw_path)
     except Exception:
         # Fallback: reconstruct from parsed data
         raw_lines = ["---"]
@@ -518,6 +600,37 @@ def _extract_what_it_does(body: str) -> str:
     return _sanitize_what_it_does(" ".join(para_lines))
 
 
+def _extract_dispatch_table(body: str) -> str:
+    """Return the ``$ARGUMENTS`` dispatch table (with its header rows) from a SKILL.md body.
+
+    Single indexed pass: the index of the first table row is recorded while
+    scanning, so the header rows are sliced directly instead of re-scanning.
+    """
+    body_lines = body.split("\n")
+    table_lines: list[str] = []
+    first_table_idx = -1
+    in_table = False
+    for i, bl in enumerate(body_lines):
+        if not in_table and "|" in bl and "$ARGUMENTS" in bl:
+            in_table = True
+        if not in_table:
+            continue
+        if bl.strip().startswith("|"):
+            if not table_lines:
+                first_table_idx = i
+            table_lines.append(bl)
+        elif table_lines:
+            break
+    if not table_lines:
+        return ""
+    # Include the header (and separator) rows directly above the $ARGUMENTS row
+    i = first_table_idx
+    header_idx = i - 2 if i >= 2 and body_lines[i - 1].strip().startswith("|") else i - 1
+    if header_idx >= 0 and body_lines[header_idx].strip().startswith("|"):
+        table_lines = [bl for bl in body_lines[header_idx:i] if bl.strip().startswith("|")] + table_lines
+    return "\n".join(table_lines)
+
+
 def _section_is_link_heavy(content: str) -> bool:
     """True when most markdown links in a section point at non-navigable relative paths."""
     links = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", content)
@@ -527,8 +640,13 @@ def _section_is_link_heavy(content: str) -> bool:
     return relative / len(links) > 0.5
 
 
+def _catalog_prose_line(line: str) -> str:
+    return sanitize_catalog_link_line(escape_mdx_line(line))
+
+
 def _catalog_prose(text: str) -> str:
-    return sanitize_catalog_links(escape_mdx(text), fence_aware=True)
+    """MDX-escape and link-sanitize *text* in one fence-aware pass."""
+    return process_outside_fences(text, _catalog_prose_line)
 
 
 def _extract_body_sections(body: str) -> dict[str, str]:
@@ -743,29 +861,29 @@ def _render_curated_trust_section(node: CatalogNode) -> list[str]:
     return parts
 
 
-def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: list[CatalogNode]) -> str:
+def render_skill_page(
+    node: CatalogNode,
+    edges: list[CatalogEdge],
+    all_nodes: list[CatalogNode],
+    *,
+    edges_by_target: dict[str, list[CatalogEdge]] | None = None,
+    nodes_by_key: dict[tuple[str, str], CatalogNode] | None = None,
+) -> str:
     fm = node.metadata
     meta = fm.get("metadata", {})
-    parts = []
+    if nodes_by_key is None:
+        nodes_by_key = index_nodes_by_key(all_nodes)
+    parts: list[str] = []
     density = resolve_density(node, default=DEFAULT_SKILL_DENSITY)
-    has_source_disclosure = should_emit_skill_source_disclosure(node, is_stub=bool(node.metadata.get("_is_stub")))
-
-    is_stub = bool(node.metadata.get("_is_stub"))
+    is_stub = bool(fm.get("_is_stub"))
+    has_source_disclosure = should_emit_skill_source_disclosure(node, is_stub=is_stub)
     raw_content = read_raw_content(node) if not is_stub else ""
 
     # Frontmatter (catalog contract — page_kind/source_kind/asset_id/...)
     parts.append("---")
     parts.extend(render_catalog_frontmatter_lines(node, composed=False))
     parts.append("---")
-    parts.append("")
-    parts.append("{/* GENERATED by wagents docs generate — do not edit */}")
-    parts.append("")
-
-    # Imports
-    parts.append(
-        "import { Badge, Tabs, TabItem, Card, CardGrid, LinkCard, Aside, Steps } from '@astrojs/starlight/components';"
-    )
-    parts.append("")
+    parts.append(_SKILL_PAGE_PREAMBLE)
 
     # === TIER 1: Human summary ===
     parts.extend(_render_skill_page_header(node, fm, density=density))
@@ -776,7 +894,7 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("")
 
     research_body = load_skill_research(node.id)
-    is_enriched_stub = bool(node.source == "curated-external" and node.metadata.get("_is_stub") and research_body)
+    is_enriched_stub = bool(node.source == "curated-external" and is_stub and research_body)
 
     if should_emit_source_aside(density):
         parts.append('<Aside type="note" title="Source & provenance">')
@@ -792,7 +910,7 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
                 "`docs/public/generated-registries/skills-catalog-index.json` by "
                 "`wagents docs generate`."
             )
-            if node.metadata.get("_is_stub"):
+            if is_stub:
                 if is_enriched_stub:
                     parts.append(
                         " Enriched from research cache (stub); the upstream SKILL.md body is not present locally."
@@ -873,37 +991,7 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("</Aside>")
         parts.append("")
 
-    # Extract dispatch table if present
-    dispatch_table = ""
-    if node.body:
-        body_lines = node.body.split("\n")
-        table_lines = []
-        in_table = False
-        for bl in body_lines:
-            if "|" in bl and ("$ARGUMENTS" in bl or "\\$ARGUMENTS" in bl):
-                in_table = True
-            if in_table:
-                if bl.strip().startswith("|"):
-                    table_lines.append(bl)
-                elif bl.strip() == "":
-                    if table_lines:
-                        break
-                else:
-                    if table_lines:
-                        break
-        # Include the header row before the $ARGUMENTS row
-        if table_lines:
-            for i, bl in enumerate(body_lines):
-                if bl == table_lines[0]:
-                    header_idx = i - 2 if i >= 2 and body_lines[i - 1].strip().startswith("|") else i - 1
-                    if header_idx >= 0 and body_lines[header_idx].strip().startswith("|"):
-                        prefix = []
-                        for j in range(header_idx, i):
-                            if body_lines[j].strip().startswith("|"):
-                                prefix.append(body_lines[j])
-                        table_lines = prefix + table_lines
-                    break
-            dispatch_table = "\n".join(table_lines)
+    dispatch_table = _extract_dispatch_table(node.body) if node.body else ""
 
     if dispatch_table:
         parts.append("## Modes")
@@ -930,38 +1018,26 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("")
 
     # Tabbed metadata (with single-tab fix)
-    tab_items = []
+    tab_items: list[tuple[str, str]] = []
 
     # Public metadata tab
     tab_items.append((
         "Public Metadata",
-        "| Field | Value |\n| ----- | ----- |\n" + "\n".join(_skill_public_metadata_rows(node)),
+        _field_table(_skill_public_metadata_rows(node)),
     ))
 
     # General tab
-    general_rows = []
-    if fm.get("name"):
-        general_rows.append(f"| Name | `{fm['name']}` |")
-    if fm.get("license"):
-        general_rows.append(f"| License | {fm['license']} |")
-    if isinstance(meta, dict) and meta.get("version"):
-        general_rows.append(f"| Version | {meta['version']} |")
-    if isinstance(meta, dict) and meta.get("author"):
-        general_rows.append(f"| Author | {meta['author']} |")
+    general_rows = _field_rows(fm, _SKILL_GENERAL_FIELDS)
+    if isinstance(meta, dict):
+        general_rows.extend(_field_rows(meta, _SKILL_META_FIELDS))
     if general_rows:
         tab_items.append((
             "General",
-            "| Field | Value |\n| ----- | ----- |\n" + "\n".join(general_rows),
+            _field_table(general_rows),
         ))
 
     # Claude Code tab
-    cc_rows = []
-    if fm.get("model"):
-        cc_rows.append(f"| Model | `{fm['model']}` |")
-    if fm.get("context"):
-        cc_rows.append(f"| Context | `{fm['context']}` |")
-    if fm.get("agent"):
-        cc_rows.append(f"| Agent | `{fm['agent']}` |")
+    cc_rows = _field_rows(fm, _SKILL_CLAUDE_CODE_FIELDS)
     if fm.get("argument-hint"):
         # Replace angle brackets — MDX parses <word> as JSX inside TabItem
         hint = fm["argument-hint"].replace("<", "[").replace(">", "]")
@@ -973,32 +1049,30 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
     if cc_rows:
         tab_items.append((
             "Claude Code",
-            "| Field | Value |\n| ----- | ----- |\n" + "\n".join(cc_rows),
+            _field_table(cc_rows),
         ))
 
     # Compatibility tab
-    compat_rows = []
-    if fm.get("compatibility"):
-        compat_rows.append(f"| Compatibility | {fm['compatibility']} |")
-    if fm.get("allowed-tools"):
-        compat_rows.append(f"| Allowed Tools | `{fm['allowed-tools']}` |")
+    compat_rows = _field_rows(fm, _SKILL_COMPAT_FIELDS)
     if compat_rows:
         tab_items.append((
             "Compatibility",
-            "| Field | Value |\n| ----- | ----- |\n" + "\n".join(compat_rows),
+            _field_table(compat_rows),
         ))
 
     parts.extend(render_tabs(tab_items, density=density))
 
     # Cross-links (Used By)
-    related_edges = [e for e in edges if e.to_id == f"skill:{node.id}"]
+    if edges_by_target is None:
+        edges_by_target = group_edges_by_target(edges)
+    related_edges = edges_by_target.get(f"skill:{node.id}", [])
     if related_edges:
         parts.append("## Used By")
         parts.append("")
         parts.append("<CardGrid>")
         for edge in related_edges:
             agent_id = edge.from_id.split(":")[1]
-            agent_node = next((n for n in all_nodes if n.kind == "agent" and n.id == agent_id), None)
+            agent_node = nodes_by_key.get(("agent", agent_id))
             if agent_node:
                 desc = escape_attr(truncate_sentence(agent_node.description, 160))
                 parts.append(
@@ -1014,7 +1088,7 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("")
         parts.append("<CardGrid>")
         for rel_id in related:
-            rel_node = next((n for n in all_nodes if n.kind == "skill" and n.id == rel_id), None)
+            rel_node = nodes_by_key.get(("skill", rel_id))
             if rel_node:
                 desc = escape_attr(truncate_sentence(rel_node.description, 160))
                 href = skill_detail_href(rel_id, node=rel_node)
@@ -1028,13 +1102,13 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
     # Agents show system prompts inline (read-to-understand artifacts). This is intentional.
     if not is_stub:
         outer_fence = safe_outer_fence(raw_content)
-        parts.append('<details class="source-disclosure">')
-        parts.append("<summary>View Full SKILL.md</summary>")
-        parts.append("")
-        parts.append(f"{outer_fence}yaml")
-        parts.append(raw_content)
-        parts.append(outer_fence)
-        parts.append("")
+        parts.append(f"""<details class="source-disclosure">
+<summary>View Full SKILL.md</summary>
+
+{outer_fence}yaml
+{raw_content}
+{outer_fence}
+""")
         if node.source == "custom":
             parts.append(
                 f"[Download from GitHub](https://raw.githubusercontent.com/wyattowalsh/agents/main/{node.source_path})"
@@ -1072,36 +1146,40 @@ def render_skill_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
     return "\n".join(parts)
 
 
-def render_agent_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: list[CatalogNode]) -> str:
+def render_agent_page(
+    node: CatalogNode,
+    edges: list[CatalogEdge],
+    all_nodes: list[CatalogNode],
+    *,
+    nodes_by_key: dict[tuple[str, str], CatalogNode] | None = None,
+) -> str:
     fm = node.metadata
-    parts = []
+    if nodes_by_key is None:
+        nodes_by_key = index_nodes_by_key(all_nodes)
+    model = fm.get("model")
+    permission_mode = fm.get("permissionMode")
+    skills = fm.get("skills")
+    mcp_servers = fm.get("mcpServers")
+    parts: list[str] = []
     raw_content = read_raw_content(node)
 
     # Frontmatter (catalog contract)
     parts.append("---")
     parts.extend(render_catalog_frontmatter_lines(node, composed=False))
     parts.append("---")
-    parts.append("")
-    parts.append("{/* GENERATED by wagents docs generate — do not edit */}")
-    parts.append("")
-
-    # Imports
-    parts.append(
-        "import { Badge, Tabs, TabItem, Card, CardGrid, LinkCard, Aside } from '@astrojs/starlight/components';"
-    )
-    parts.append("")
+    parts.append(_AGENT_PAGE_PREAMBLE)
 
     # Badge row
-    badges = []
+    badges: list[str] = []
     badges.append('<Badge text="Agent Config" variant="note" />')
-    if fm.get("model") and fm["model"] != "inherit":
-        badges.append(f'<Badge text="{escape_attr(fm["model"])}" variant="tip" />')
-    if fm.get("permissionMode") and fm["permissionMode"] != "default":
-        badges.append(f'<Badge text="{escape_attr(fm["permissionMode"])}" variant="caution" />')
-    if isinstance(fm.get("skills"), list):
-        badges.append(f'<Badge text="{len(fm.get("skills", []))} skills" variant="default" />')
-    if isinstance(fm.get("mcpServers"), list):
-        badges.append(f'<Badge text="{len(fm.get("mcpServers", []))} MCP servers" variant="default" />')
+    if model and model != "inherit":
+        badges.append(f'<Badge text="{escape_attr(model)}" variant="tip" />')
+    if permission_mode and permission_mode != "default":
+        badges.append(f'<Badge text="{escape_attr(permission_mode)}" variant="caution" />')
+    if isinstance(skills, list):
+        badges.append(f'<Badge text="{len(skills)} skills" variant="default" />')
+    if isinstance(mcp_servers, list):
+        badges.append(f'<Badge text="{len(mcp_servers)} MCP servers" variant="default" />')
     if badges:
         parts.append(" ".join(badges))
         parts.append("")
@@ -1127,52 +1205,40 @@ def render_agent_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("")
 
     # Tabbed config (with single-tab fix)
-    tab_items = []
+    tab_items: list[tuple[str, str]] = []
 
     # Identity tab
-    id_rows = [f"| Name | `{fm.get('name', node.id)}` |"]
-    if fm.get("model"):
-        id_rows.append(f"| Model | `{fm['model']}` |")
-    if fm.get("permissionMode"):
-        id_rows.append(f"| Permission Mode | `{fm['permissionMode']}` |")
-    if fm.get("maxTurns"):
-        id_rows.append(f"| Max Turns | {fm['maxTurns']} |")
-    if fm.get("memory"):
-        id_rows.append(f"| Memory | `{fm['memory']}` |")
-    tab_items.append(("Identity", "| Field | Value |\n| ----- | ----- |\n" + "\n".join(id_rows)))
+    id_rows = [f"| Name | `{fm.get('name', node.id)}` |", *_field_rows(fm, _AGENT_IDENTITY_FIELDS)]
+    tab_items.append(("Identity", _field_table(id_rows)))
 
     # Tools tab
-    tools_rows = []
-    if fm.get("tools"):
-        tools_rows.append(f"| Allowed | `{fm['tools']}` |")
-    if fm.get("disallowedTools"):
-        tools_rows.append(f"| Disallowed | `{fm['disallowedTools']}` |")
+    tools_rows = _field_rows(fm, _AGENT_TOOLS_FIELDS)
     if tools_rows:
-        tab_items.append(("Tools", "| Field | Value |\n| ----- | ----- |\n" + "\n".join(tools_rows)))
+        tab_items.append(("Tools", _field_table(tools_rows)))
 
     # Integrations tab
-    int_rows = []
-    if fm.get("skills"):
-        skills_list = ", ".join(f"`{s}`" for s in fm["skills"])
+    int_rows: list[str] = []
+    if skills:
+        skills_list = ", ".join(f"`{s}`" for s in skills)
         int_rows.append(f"| Skills | {skills_list} |")
-    if fm.get("mcpServers"):
-        mcp_list = ", ".join(f"`{m}`" for m in fm["mcpServers"])
+    if mcp_servers:
+        mcp_list = ", ".join(f"`{m}`" for m in mcp_servers)
         int_rows.append(f"| MCP Servers | {mcp_list} |")
     if int_rows:
         tab_items.append((
             "Integrations",
-            "| Field | Value |\n| ----- | ----- |\n" + "\n".join(int_rows),
+            _field_table(int_rows),
         ))
 
     parts.extend(render_tabs(tab_items))
 
     # Skills as LinkCard grid (from frontmatter; includes missing-node fallback)
-    if fm.get("skills") and isinstance(fm["skills"], list):
+    if skills and isinstance(skills, list):
         parts.append("## Skills")
         parts.append("")
         parts.append("<CardGrid>")
-        for skill_name in fm["skills"]:
-            skill_node = next((n for n in all_nodes if n.kind == "skill" and n.id == skill_name), None)
+        for skill_name in skills:
+            skill_node = nodes_by_key.get(("skill", skill_name))
             if skill_node:
                 desc = escape_attr(truncate_sentence(skill_node.description, 160))
                 parts.append(
@@ -1188,12 +1254,12 @@ def render_agent_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("")
 
     # MCP Servers as LinkCard grid
-    if fm.get("mcpServers") and isinstance(fm["mcpServers"], list):
+    if mcp_servers and isinstance(mcp_servers, list):
         parts.append("## MCP Servers")
         parts.append("")
         parts.append("<CardGrid>")
-        for mcp_name in fm["mcpServers"]:
-            mcp_node = next((n for n in all_nodes if n.kind == "mcp" and n.id == mcp_name), None)
+        for mcp_name in mcp_servers:
+            mcp_node = nodes_by_key.get(("mcp", mcp_name))
             if mcp_node:
                 desc = escape_attr(truncate_sentence(mcp_node.description, 160))
                 parts.append(
@@ -1212,15 +1278,15 @@ def render_agent_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
         parts.append("")
 
     outer_fence = safe_outer_fence(raw_content)
-    parts.append("<details>")
-    parts.append("<summary>View Full Agent File</summary>")
-    parts.append("")
-    parts.append(f"{outer_fence}yaml")
-    parts.append(raw_content)
-    parts.append(outer_fence)
-    parts.append("")
-    parts.append("</details>")
-    parts.append("")
+    parts.append(f"""<details>
+<summary>View Full Agent File</summary>
+
+{outer_fence}yaml
+{raw_content}
+{outer_fence}
+
+</details>
+""")
 
     parts.append("## Resources")
     parts.append("")
@@ -1240,24 +1306,44 @@ def render_agent_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: li
     return "\n".join(parts)
 
 
-def render_mcp_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: list[CatalogNode]) -> str:
+# ``json.dumps(..., indent=2)`` of the claude_desktop_config.json usage snippet;
+# only the server id varies, so the layout is specialized once at import. Fill
+# ``id`` with the JSON-escaped string body (``json.dumps(node.id)[1:-1]``).
+_MCP_USAGE_CONFIG_TEMPLATE = """{{
+  "mcpServers": {{
+    "{id}": {{
+      "command": "uv",
+      "args": [
+        "run",
+        "--directory",
+        "mcp/{id}",
+        "python",
+        "server.py"
+      ]
+    }}
+  }}
+}}"""
+
+
+def render_mcp_page(
+    node: CatalogNode,
+    edges: list[CatalogEdge],
+    all_nodes: list[CatalogNode],
+    *,
+    edges_by_target: dict[str, list[CatalogEdge]] | None = None,
+    nodes_by_key: dict[tuple[str, str], CatalogNode] | None = None,
+) -> str:
     fm = node.metadata
     proj = fm.get("project", {})
-    parts = []
+    if nodes_by_key is None:
+        nodes_by_key = index_nodes_by_key(all_nodes)
+    parts: list[str] = []
 
     # Frontmatter (catalog contract)
     parts.append("---")
     parts.extend(render_catalog_frontmatter_lines(node, composed=False))
     parts.append("---")
-    parts.append("")
-    parts.append("{/* GENERATED by wagents docs generate — do not edit */}")
-    parts.append("")
-
-    # Imports
-    parts.append(
-        "import { Badge, Tabs, TabItem, Aside, Code, CardGrid, LinkCard } from '@astrojs/starlight/components';"
-    )
-    parts.append("")
+    parts.append(_MCP_PAGE_PREAMBLE)
 
     # Badges
     deps = proj.get("dependencies", [])
@@ -1284,32 +1370,18 @@ def render_mcp_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: list
     parts.append('<Aside type="tip" title="Usage">')
     parts.append("Add to your `claude_desktop_config.json`:")
     parts.append("```json")
-    mcp_config = {
-        "mcpServers": {
-            node.id: {
-                "command": "uv",
-                "args": ["run", "--directory", f"mcp/{node.id}", "python", "server.py"],
-            }
-        }
-    }
-    parts.append(json.dumps(mcp_config, indent=2))
+    parts.append(_MCP_USAGE_CONFIG_TEMPLATE.format(id=json.dumps(node.id)[1:-1]))
     parts.append("```")
     parts.append("</Aside>")
     parts.append("")
 
     # Tabbed config (with single-tab fix)
-    tab_items = []
+    tab_items: list[tuple[str, str]] = []
 
     # Package info tab
-    pkg_rows = []
-    if proj.get("name"):
-        pkg_rows.append(f"| Name | `{proj['name']}` |")
-    if proj.get("version"):
-        pkg_rows.append(f"| Version | {proj['version']} |")
-    if proj.get("requires-python"):
-        pkg_rows.append(f"| Python | `{proj['requires-python']}` |")
+    pkg_rows = _field_rows(proj, _MCP_PACKAGE_FIELDS)
     if pkg_rows:
-        tab_items.append(("Package", "| Field | Value |\n| ----- | ----- |\n" + "\n".join(pkg_rows)))
+        tab_items.append(("Package", _field_table(pkg_rows)))
 
     # Dependencies as badges
     if deps:
@@ -1352,14 +1424,16 @@ def render_mcp_page(node: CatalogNode, edges: list[CatalogEdge], all_nodes: list
     parts.append("")
 
     # Cross-links (agents that use this MCP)
-    related_edges = [e for e in edges if e.to_id == f"mcp:{node.id}"]
+    if edges_by_target is None:
+        edges_by_target = group_edges_by_target(edges)
+    related_edges = edges_by_target.get(f"mcp:{node.id}", [])
     if related_edges:
         parts.append("## Used By")
         parts.append("")
         parts.append("<CardGrid>")
         for edge in related_edges:
             agent_id = edge.from_id.split(":")[1]
-            agent_node = next((n for n in all_nodes if n.kind == "agent" and n.id == agent_id), None)
+            agent_node = nodes_by_key.get(("agent", agent_id))
             if agent_node:
                 desc = escape_attr(truncate_sentence(agent_node.description, 160))
                 parts.append(
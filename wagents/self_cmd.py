@@ -8,7 +8,7 @@ import sys
 
 import typer
 
-from wagents import VERSION
+from wagents import package_version
 from wagents.context import (
     DEFAULT_GIT_SOURCE,
     REPO_ROOT_ENV,
@@ -186,7 +186,7 @@ def self_doctor(
         {
             "name": "wagents-version",
             "status": "ok",
-            "summary": VERSION,
+            "summary": package_version(),
         },
         {
             "name": "repo-discovery",